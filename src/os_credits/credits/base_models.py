@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from dataclasses import field
 from decimal import Decimal
+from sys import intern
 from typing import Any
 from typing import ClassVar
 from typing import Dict
@@ -110,6 +111,9 @@ class Metric:
                 "names are None."
             )
             return
+        # metric names are part of every measurement and billing history point
+        name = intern(name)
+        friendly_name = intern(friendly_name)
         if name in Metric._metrics_by_name:
             raise ValueError(
                 f"Metric with name {name} is already registered: "
@@ -120,8 +124,8 @@ class Metric:
                 f"Metric with friendly_name {friendly_name} is already registered: "
                 f"{Metric.metrics_by_friendly_name[friendly_name]}"
             )
-        Metric._metrics_by_name.update({name: cls})
-        Metric.metrics_by_friendly_name.update({friendly_name: cls})
+        Metric._metrics_by_name[name] = cls
+        Metric.metrics_by_friendly_name[friendly_name] = cls
         cls.name = name
         cls.friendly_name = friendly_name
         internal_logger.debug("Registered subclass of `Metric`: %s", cls)
@@ -127,10 +127,10 @@ class InfluxDBPoint:
         tag_field_dict: Dict[str, str] = {}
         for tag_pair in tag_set.split(","):
             tag_name, tag_value = tag_pair.split("=", 1)
-            tag_field_dict.update({tag_name: tag_value})
+            tag_field_dict[tag_name] = tag_value
         for field_pair in field_set.split(","):
             field_name, field_value = field_pair.split("=", 1)
-            tag_field_dict.update({field_name: field_value})
+            tag_field_dict[field_name] = field_value
         # we know how to deserialize those
         args: Dict[str, Any] = {
             "measurement": measurement_name,
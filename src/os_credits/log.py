@@ -85,27 +85,14 @@ DEFAULT_LOGGING_CONFIG = {
             "formatter": "simple_handler",
         },
     },
+    # all loggers share the same configuration except for their level
     "loggers": {
-        "os_credits.tasks": {
-            "level": DEFAULT_LOG_LEVEL["os_credits.tasks"],
+        logger_name: {
+            "level": level,
             "handlers": ["with_task_id"],
             "filters": ["task_id_filter"],
-        },
-        "os_credits.internal": {
-            "level": DEFAULT_LOG_LEVEL["os_credits.internal"],
-            "handlers": ["with_task_id"],
-            "filters": ["task_id_filter"],
-        },
-        "os_credits.requests": {
-            "level": DEFAULT_LOG_LEVEL["os_credits.requests"],
-            "handlers": ["with_task_id"],
-            "filters": ["task_id_filter"],
-        },
-        "os_credits.influxdb": {
-            "level": DEFAULT_LOG_LEVEL["os_credits.influxdb"],
-            "handlers": ["with_task_id"],
-            "filters": ["task_id_filter"],
-        },
+        }
+        for logger_name, level in DEFAULT_LOG_LEVEL.items()
     },
 }
 """Passed to :func:`~logging.config.dictConfig` in at :ref:`Startup`.
@@ -13,8 +13,6 @@ from pathlib import Path
 from pprint import pformat
 from typing import Optional
 
-from aiohttp import BasicAuth
-from aiohttp import ClientSession
 from aiohttp import web
 from aiohttp_jinja2 import setup
 from aiohttp_swagger import setup_swagger
@@ -26,6 +24,8 @@ from os_credits.exceptions import MissingInfluxDatabase
 from os_credits.influx.client import InfluxDBClient
 from os_credits.log import internal_logger
 from os_credits.perun.requests import client_session
+from os_credits.perun.requests import close_fallback_session
+from os_credits.perun.requests import create_perun_session
 from os_credits.prometheus_metrics import projects_processed_counter
 from os_credits.prometheus_metrics import tasks_queued_gauge
 from os_credits.views import application_stats
@@ -77,14 +77,7 @@ async def stop_worker(app: web.Application, queue_timeout: int = 120) -> None:
 
 
 async def create_client_session(app: web.Application) -> None:
-    client_session.set(
-        ClientSession(
-            auth=BasicAuth(
-                app["config"]["OS_CREDITS_PERUN_LOGIN"],
-                app["config"]["OS_CREDITS_PERUN_PASSWORD"],
-            )
-        )
-    )
+    client_session.set(create_perun_session())
 
 
 async def setup_prometheus_metrics(app: web.Application) -> None:
@@ -92,6 +85,7 @@ async def setup_prometheus_metrics(app: web.Application) -> None:
 
 
 async def close_client_sessions(app: web.Application) -> None:
+    await close_fallback_session()
     try:
         await client_session.get().close()
         await app["influx_client"].close()
@@ -182,6 +176,8 @@ async def create_app(
         task_queue=Queue(),
         group_locks=defaultdict(create_new_group_lock),
         start_time=datetime.now(),
+        # filled by :func:`os_credits.views.application_stats`
+        verbose_stats_cache={},
         config=config,
     )
 
@@ -192,8 +188,11 @@ async def create_app(
             "access."
         )
 
-    # setup jinja2 template engine
-    setup(app, loader=FileSystemLoader(str(APP_ROOT / "templates")))
+    # setup jinja2 template engine, the templates are part of the package and do not
+    # change at runtime, so do not check them for modifications on every render
+    setup(
+        app, loader=FileSystemLoader(str(APP_ROOT / "templates")), auto_reload=False
+    )
 
     app.on_startup.append(create_client_session)
     app.on_startup.append(create_worker)
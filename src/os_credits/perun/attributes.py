@@ -5,7 +5,6 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -16,6 +15,8 @@ from .base_attributes import CreditTimestamps
 from .base_attributes import ReadOnlyScalarPerunAttribute
 from .base_attributes import ScalarPerunAttribute
 from .base_attributes import ToEmails
+from .base_attributes import _TrackedDict
+from .base_attributes import _TrackedList
 from .exceptions import DenbiCreditsGrantedMissing
 
 PERUN_NAMESPACE_OPT = "urn:perun:group:attribute-def:opt"
@@ -48,8 +49,7 @@ class DenbiCreditsUsed(
         of the attribute inside Perun.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     def perun_deserialize(self, value: Optional[str]) -> Optional[Decimal]:
         return Decimal(value) if value else None
@@ -72,8 +72,7 @@ class DenbiCreditsGranted(
     it since the Cloud portal owns this value and will change it without telling us.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     def perun_deserialize(self, value: Optional[str]) -> int:
         """Stored as str inside perun, unfortunately"""
@@ -98,11 +97,10 @@ class ToEmail(
     Used to send :ref:`Notifications` in case of expired credits or other events.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     def perun_deserialize(self, value: Optional[List[str]]) -> ToEmails:
-        return value if value else []
+        return _TrackedList(value) if value else _TrackedList()
 
 
 class DenbiCreditTimestamps(
@@ -121,24 +119,22 @@ class DenbiCreditTimestamps(
     is stored, is the most recent one used to bill this metric.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     def perun_deserialize(self, value: Optional[Dict[str, str]]) -> CreditTimestamps:
-        measurement_timestamps = {}
-        if value is not None:
-            for measurement_str, timestamp_str in value.items():
-                measurement_timestamps.update(
-                    {
-                        measurement_str: datetime.strptime(
-                            timestamp_str, PERUN_DATETIME_FORMAT
-                        )
-                    }
-                )
-        return measurement_timestamps
+        if not value:
+            return _TrackedDict()
+        return _TrackedDict(
+            {
+                measurement_str: datetime.strptime(timestamp_str, PERUN_DATETIME_FORMAT)
+                for measurement_str, timestamp_str in value.items()
+            }
+        )
 
     def perun_serialize(self, value: CreditTimestamps) -> Dict[str, str]:
+        # equivalent to formatting naive timestamps with ``PERUN_DATETIME_FORMAT`` but
+        # without going through the format string interpreter of ``strftime``
         return {
-            measurement: timestamp.strftime(PERUN_DATETIME_FORMAT)
+            measurement: timestamp.isoformat(sep=" ", timespec="microseconds")
             for measurement, timestamp in value.items()
         }
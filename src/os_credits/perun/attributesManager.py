@@ -5,10 +5,12 @@ https://perun-aai.org/documentation/technical-documentation/rpc-api/rpc-javadoc-
 
 from __future__ import annotations
 
+from asyncio import gather
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import cast
 
 from .base_attributes import PerunAttribute
@@ -19,11 +21,13 @@ _URL = "attributesManager"
 
 
 async def get_resource_bound_attributes(
-    group_id: int, resource_id: int, attribute_full_names: Optional[List[str]] = None
+    group_id: int,
+    resource_id: int,
+    attribute_full_names: Optional[Sequence[str]] = None,
 ) -> List[Dict[str, Any]]:
     params: Dict[str, Any] = {"group": group_id, "resource": resource_id}
     if attribute_full_names:
-        params.update({"attrNames": attribute_full_names})
+        params["attrNames"] = attribute_full_names
     # cast is only for type checking purposes
     return cast(
         List[Dict[str, Any]], await perun_get(f"{_URL}/getAttributes", params=params)
@@ -31,11 +35,11 @@ async def get_resource_bound_attributes(
 
 
 async def get_attributes(
-    group_id: int, attribute_full_names: Optional[List[str]] = None
+    group_id: int, attribute_full_names: Optional[Sequence[str]] = None
 ) -> List[Dict[str, Any]]:
     params: Dict[str, Any] = {"group": group_id}
     if attribute_full_names:
-        params.update({"attrNames": attribute_full_names})
+        params["attrNames"] = attribute_full_names
     # cast is only for type checking purposes
     return cast(
         List[Dict[str, Any]], await perun_get(f"{_URL}/getAttributes", params=params)
@@ -43,30 +47,91 @@ async def get_attributes(
 
 
 async def set_attribute(group_id: int, attribute: PerunAttribute[Any]) -> None:
-    await perun_set(
-        f"{_URL}/setAttribute",
-        {"group": group_id, "attribute": attribute.to_perun_dict()},
-    )
+    """Shortcut for :func:`set_attributes` with a single attribute. Use
+    :func:`flush_attributes` or :func:`set_attributes` directly when setting multiple
+    attributes to send them with a single request.
+    """
+    await set_attributes(group_id, [attribute])
 
 
 async def set_resource_bound_attributes(
-    group_id: int, resource_id: int, attributes: List[PerunAttribute[Any]]
+    group_id: int,
+    resource_id: int,
+    attributes: List[PerunAttribute[Any]],
+    only_changed: bool = False,
 ) -> None:
+    """See :func:`set_attributes`."""
+    encoded_attributes = [
+        attr.to_perun_bytes()
+        for attr in attributes
+        if not only_changed or attr.has_changed
+    ]
+    if not encoded_attributes:
+        return
     await perun_set(
         f"{_URL}/setAttributes",
-        {
-            "group": group_id,
-            "resource": resource_id,
-            "attributes": [attr.to_perun_dict() for attr in attributes],
-        },
+        b'{"group":%d,"resource":%d,"attributes":[%s]}'
+        % (group_id, resource_id, b",".join(encoded_attributes)),
     )
 
 
-async def set_attributes(group_id: int, attributes: List[PerunAttribute[Any]]) -> None:
+async def set_attributes(
+    group_id: int, attributes: List[PerunAttribute[Any]], only_changed: bool = False
+) -> None:
+    """The request body is assembled from the already JSON encoded attributes, see
+    :func:`~os_credits.perun.base_attributes.PerunAttribute.to_perun_bytes`.
+
+    :param only_changed: Neither serialize nor send attributes whose value has not
+        changed, no request is sent at all if none of them has changed. Used by
+        :func:`~os_credits.perun.group.Group.save`.
+    """
+    encoded_attributes = [
+        attr.to_perun_bytes()
+        for attr in attributes
+        if not only_changed or attr.has_changed
+    ]
+    if not encoded_attributes:
+        return
     await perun_set(
         f"{_URL}/setAttributes",
-        {
-            "group": group_id,
-            "attributes": [attr.to_perun_dict() for attr in attributes],
-        },
+        b'{"group":%d,"attributes":[%s]}' % (group_id, b",".join(encoded_attributes)),
     )
+
+
+async def flush_attributes(
+    group_id: int,
+    attributes: List[PerunAttribute[Any]],
+    resource_id: Optional[int] = None,
+) -> None:
+    """Send all changed attributes of a group to *Perun* with at most one request per
+    kind of attribute instead of one request per attribute. Both requests are sent
+    concurrently.
+
+    :param group_id: ID of the group the attributes belong to.
+    :param attributes: Attributes to send, unchanged ones are skipped.
+    :param resource_id: ID of the resource used for *resource bound* attributes.
+        Required if any of them has changed.
+    :raises ValueError: If resource bound attributes have changed but no
+        ``resource_id`` is given, nothing is sent in this case.
+    """
+    changed_attrs: List[PerunAttribute[Any]] = []
+    changed_resource_bound_attrs: List[PerunAttribute[Any]] = []
+    for attr in attributes:
+        if not attr.has_changed:
+            continue
+        if attr.is_resource_bound():
+            changed_resource_bound_attrs.append(attr)
+        else:
+            changed_attrs.append(attr)
+    save_requests = []
+    if changed_resource_bound_attrs:
+        if resource_id is None:
+            raise ValueError("Resource bound attributes require a `resource_id`.")
+        save_requests.append(
+            set_resource_bound_attributes(
+                group_id, resource_id, changed_resource_bound_attrs
+            )
+        )
+    if changed_attrs:
+        save_requests.append(set_attributes(group_id, changed_attrs))
+    await gather(*save_requests)
@@ -5,17 +5,71 @@ subclasses.
 from __future__ import annotations
 
 from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 from typing import Dict
-from typing import Generic
 from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import cast
+
+from orjson import dumps
+
+if TYPE_CHECKING:
+    from typing import Generic
+else:
+
+    class Generic:
+        """Runtime stand-in for :class:`typing.Generic`. The type parameters of the
+        attribute classes are only of interest to the type checker, subscripting a
+        class therefore simply returns it instead of creating a parametrized alias and
+        the whole ``__orig_bases__``/``__parameters__`` bookkeeping is skipped.
+        """
+
+        __slots__ = ()
+
+        def __class_getitem__(cls, params: Any) -> Any:
+            return cls
+
 
 PERUN_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 # ValueType
 VT = TypeVar("VT")
 
+# only written to by :func:`PerunAttribute.__init_subclass__`, everybody else uses the
+# read-only view :attr:`PerunAttribute.registered_attributes`
+_registered_attributes: Dict[str, Type["PerunAttribute"[Any]]] = {}
+
+# Source of the specialized :func:`PerunAttribute.to_perun_dict` generated for every
+# attribute class, see :func:`_generate_to_perun_dict`
+_TO_PERUN_DICT_SOURCE = """\
+def to_perun_dict(self):
+    return {{
+        "namespace": {namespace!r},
+        "id": {id!r},
+        "friendlyName": {friendly_name!r},
+        "type": {type!r},
+        "value": {value},
+    }}
+"""
+
+# Source of the specialized ``__repr__`` generated for every attribute class, see
+# :func:`_generate_repr`
+_REPR_SOURCE = """\
+def __repr__(self):
+    # This assumes that either the container value evaluates to false or in the
+    # scalar case that the attribute is None
+    if not self._value:
+        return {empty_repr!r}
+    return f{repr_format!r}
+"""
+
 
 class PerunAttribute(Generic[VT]):
     """Base class of all *Perun* attributes. The :class:`~typing.Generic` base class is
@@ -40,13 +94,25 @@ class PerunAttribute(Generic[VT]):
 
     """
 
-    _updated = False
-    _value: VT
+    __slots__ = ("_value", "_updated", "_encoded")
 
-    registered_attributes: Dict[str, Type["PerunAttribute"[Any]]] = {}
-    """Mapping between the name of a subclass of PerunAttribute and the actual class
-     object, needed to determine the class of a requested attribute of a group, see
-     :func:`~os_credits.perun.group.Group.get_perun_attributes`.
+    _updated: bool
+    _value: VT
+    # memo of :func:`to_perun_bytes` together with the :func:`_encoding_token` it was
+    # created with
+    _encoded: Optional[Tuple[Any, bytes]]
+    _resource_bound = False
+    # whether the class keeps the default :func:`perun_deserialize`, i.e. the identity
+    _identity_deserialize = False
+    _full_name: str
+    _generated_to_perun_dict: Optional[Callable[..., Dict[str, Any]]] = None
+
+    registered_attributes: ClassVar[
+        Mapping[str, Type["PerunAttribute"[Any]]]
+    ] = MappingProxyType(_registered_attributes)
+    """Read-only mapping between the name of a subclass of PerunAttribute and the actual
+     class object, needed to determine the class of a requested attribute of a group,
+     see :func:`~os_credits.perun.group.Group.get_perun_attributes`.
      """
 
     friendlyName: str
@@ -79,7 +145,25 @@ class PerunAttribute(Generic[VT]):
         cls.id = perun_id
         cls.type = perun_type
         cls.namespace = perun_namespace
-        PerunAttribute.registered_attributes[cls.__name__] = cls
+        cls._resource_bound = "group_resource" in perun_namespace.split(":")
+        cls._identity_deserialize = (
+            cls.perun_deserialize is PerunAttribute.perun_deserialize
+        )
+        cls._full_name = f"{perun_namespace}:{perun_friendly_name}"
+        # do not replace an implementation provided by the class itself or one of its
+        # bases, only the generic one or one generated for a base class
+        if cls.to_perun_dict in (
+            PerunAttribute.to_perun_dict,
+            cls._generated_to_perun_dict,
+        ):
+            cls._generated_to_perun_dict = _generate_to_perun_dict(cls)
+            cls.to_perun_dict = cls._generated_to_perun_dict  # type: ignore
+        if "__repr__" not in vars(cls):
+            cls.__repr__ = _generate_repr(cls)  # type: ignore
+        # private helper classes are never requested by a group
+        if cls.__name__.startswith("_"):
+            return
+        _registered_attributes[cls.__name__] = cls
 
     def __init__(self, value: Any, **kwargs: Any) -> None:
         """Using kwargs since :func:`~os_credits.perun.group.Group.connect` calls us
@@ -89,27 +173,52 @@ class PerunAttribute(Generic[VT]):
         Once other *subattributes* are needed by the code, e.g. ``value_modified_at``,
         they should be added to the function signature and set inside this constructor.
         """
-        self._value = self.perun_deserialize(value)
+        self._value = (
+            value if self._identity_deserialize else self.perun_deserialize(value)
+        )
+        self._updated = False
+        self._encoded = None
 
     def to_perun_dict(self) -> Dict[str, Any]:
         """Serialize the attribute into a dictionary which can passed as JSON content to
         the perun API.
+
+        Replaced for every attribute class by a specialized version with the invariant
+        parts inlined, see :func:`_generate_to_perun_dict`.
         """
         return {
-            "value": self.perun_serialize(self._value),
             "namespace": self.namespace,
             "id": self.id,
             "friendlyName": self.friendlyName,
             "type": self.type,
+            "value": self.perun_serialize(self._value),
         }
 
+    def to_perun_bytes(self) -> bytes:
+        """JSON encoded version of :func:`to_perun_dict`, reused as long as the value of
+        the attribute does not change.
+        """
+        token = self._encoding_token()
+        encoded = self._encoded
+        if encoded is None or encoded[0] != token:
+            encoded = (token, dumps(self.to_perun_dict()))
+            self._encoded = encoded
+        return encoded[1]
+
+    def _encoding_token(self) -> Any:
+        """Used by :func:`to_perun_bytes` to determine whether its memo is still valid.
+        Attributes whose value can change without :attr:`_encoded` being reset have to
+        return a token which changes as well.
+        """
+        return None
+
     @classmethod
     def get_full_name(cls) -> str:
         """Needed when querying specific attributes of a group instead of all of them.
 
         :return: Full name of the attribute inside *Perun*.
         """
-        return f"{cls.namespace}:{cls.friendlyName}"
+        return cls._full_name
 
     def perun_deserialize(self, value: Any) -> Any:
         """Deserialize from the type/format used by *Perun* when converting into JSON to
@@ -133,9 +242,9 @@ class PerunAttribute(Generic[VT]):
     def is_resource_bound(cls) -> bool:
         """
         Whether this attribute is not only bound to one specific group but a combination
-        of group and resource.
+        of group and resource. Determined once when the subclass is created.
         """
-        return "group_resource" in cls.namespace.split(":")
+        return cls._resource_bound
 
     @property
     def has_changed(self) -> bool:
@@ -154,24 +263,93 @@ class PerunAttribute(Generic[VT]):
         return str(self._value)
 
     def __repr__(self) -> str:
+        """Only used by classes without *Perun* metadata, every attribute class gets a
+        specialized version also showing its metadata, see :func:`_generate_repr`.
+        """
         # This assumes that either the container value evaluates to false or in the
         # scalar case that the attribute is None
         if not self._value:
             return f"{type(self).__name__}(value=None)"
-        param_repr: List[str] = [f"value={self._value}"]
-        for attribute in filter(
-            lambda attribute: not attribute.startswith("_"), self.__annotations__.keys()
-        ):
-            # None of the values are set in offline mode
-            if attribute in dir(self):
-                param_repr.append(f"{attribute}={repr(getattr(self, attribute))}")
-
-        return f"{type(self).__name__}({','.join(param_repr)})"
+        return f"{type(self).__name__}(value={self._value})"
 
     def __bool__(self) -> bool:
         return bool(self._value)
 
 
+def _generate_to_perun_dict(
+    cls: Type[PerunAttribute[Any]],
+) -> Callable[..., Dict[str, Any]]:
+    """Generate :func:`PerunAttribute.to_perun_dict` for the given attribute class with
+    its *Perun* metadata inlined as literals. The call to :func:`perun_serialize` is
+    left out if the class does not overwrite it, since the default implementation is
+    the identity.
+    """
+    if cls.perun_serialize is PerunAttribute.perun_serialize:
+        value = "self._value"
+    else:
+        value = "self.perun_serialize(self._value)"
+    source = _TO_PERUN_DICT_SOURCE.format(
+        namespace=cls.namespace,
+        id=cls.id,
+        friendly_name=cls.friendlyName,
+        type=cls.type,
+        value=value,
+    )
+    return cast(
+        Callable[..., Dict[str, Any]], _compile_method(cls, "to_perun_dict", source)
+    )
+
+
+def _generate_repr(cls: Type[PerunAttribute[Any]]) -> Callable[..., str]:
+    """Generate ``__repr__`` for the given attribute class. All public annotated
+    attributes of the class, except class level registries, are shown. Those already
+    set on the class itself, such as its *Perun* metadata, are always present and put
+    into the format string directly.
+    """
+    annotations: Dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        annotations.update(vars(klass).get("__annotations__", {}))
+    fields: List[str] = []
+    for attribute, annotation in annotations.items():
+        if attribute.startswith("_") or _is_class_var(annotation):
+            continue
+        if hasattr(cls, attribute):
+            fields.append(f",{attribute}={{self.{attribute}!r}}")
+        else:
+            # None of the values are set in offline mode
+            fields.append(f"{{_repr_if_set(self, {attribute!r})}}")
+    source = _REPR_SOURCE.format(
+        empty_repr=f"{cls.__name__}(value=None)",
+        repr_format=f"{cls.__name__}(value={{self._value}}{''.join(fields)})",
+    )
+    return cast(Callable[..., str], _compile_method(cls, "__repr__", source))
+
+
+def _is_class_var(annotation: Any) -> bool:
+    """Annotations are only strings if postponed, see :pep:`563`."""
+    if isinstance(annotation, str):
+        return annotation.startswith("ClassVar")
+    return getattr(annotation, "__origin__", None) is ClassVar
+
+
+def _repr_if_set(obj: Any, attribute: str) -> str:
+    if not hasattr(obj, attribute):
+        return ""
+    return f",{attribute}={getattr(obj, attribute)!r}"
+
+
+def _compile_method(cls: type, name: str, source: str) -> Callable[..., Any]:
+    """Compile the source code of function ``name`` and return it, ready to be set as
+    method of ``cls``.
+    """
+    namespace: Dict[str, Any] = {"_repr_if_set": _repr_if_set}
+    exec(compile(source, f"<{name} of {cls.__qualname__}>", "exec"), namespace)
+    method = namespace[name]
+    method.__qualname__ = f"{cls.__qualname__}.{name}"
+    method.__doc__ = getattr(PerunAttribute, name).__doc__
+    return cast(Callable[..., Any], method)
+
+
 class ReadOnlyScalarPerunAttribute(
     PerunAttribute[VT],
     # class definition must contain the following attributes to allow 'passthrough' from
@@ -185,11 +363,7 @@ class ReadOnlyScalarPerunAttribute(
     scalar value, e.g. a `float` or `str`, in contrast to container attributes.
     """
 
-    def __init_subclass__(cls, **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
-
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def value(self) -> VT:
@@ -210,11 +384,7 @@ class ScalarPerunAttribute(
     :attr:`value` which makes sure that type of non-empty content does not change.
     """
 
-    def __init_subclass__(cls, **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
-
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def value(self) -> VT:
@@ -230,12 +400,142 @@ class ScalarPerunAttribute(
         if self.value != value:
             self._updated = True
             self._value = value
+            self._encoded = None
+
+
+class _TrackedDict(dict):
+    """:class:`dict` which remembers whether any of its mutating methods have been
+    called since creation or since :attr:`_dirty` has been reset. :attr:`_version`
+    counts all modifications and allows others to detect changes of the contents
+    independently of :attr:`_dirty`.
+
+    Used by :class:`ContainerPerunAttribute` to detect changes of its contents without
+    having to keep and compare a copy of them.
+    """
+
+    __slots__ = ("_dirty", "_version")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._dirty = False
+        # incremented on every modification, other than :attr:`_dirty` never reset
+        self._version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> _TrackedDict:
+        # :func:`dict.__ior__` does not exist before Python 3.9, same semantics
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        self._dirty = True
+        self._version += 1
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self._dirty = True
+        self._version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self._dirty = True
+        self._version += 1
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._dirty = True
+        self._version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().update(*args, **kwargs)
+
+
+class _TrackedList(list):
+    """:class:`list` counterpart of :class:`_TrackedDict`."""
+
+    __slots__ = ("_dirty", "_version")
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._dirty = False
+        self._version = 0
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, other: Any) -> _TrackedList:
+        self._dirty = True
+        self._version += 1
+        return super().__iadd__(other)  # type: ignore
+
+    def __imul__(self, other: Any) -> _TrackedList:
+        self._dirty = True
+        self._version += 1
+        return super().__imul__(other)  # type: ignore
+
+    def append(self, item: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().append(item)
+
+    def clear(self) -> None:
+        self._dirty = True
+        self._version += 1
+        super().clear()
+
+    def extend(self, other: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().extend(other)
+
+    def insert(self, index: Any, item: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().insert(index, item)
+
+    def pop(self, *args: Any) -> Any:
+        self._dirty = True
+        self._version += 1
+        return super().pop(*args)
+
+    def remove(self, item: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().remove(item)
+
+    def reverse(self) -> None:
+        self._dirty = True
+        self._version += 1
+        super().reverse()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._dirty = True
+        self._version += 1
+        super().sort(*args, **kwargs)
 
 
 ToEmails = List[str]
 CreditTimestamps = Dict[str, datetime]
-# "ContainerValueType", used by type checker, to ensure that the classes defines a
-# `.copy` method
+# "ContainerValueType", used by type checker, to ensure that the classes are containers
 CVT = TypeVar("CVT", ToEmails, CreditTimestamps)
 
 
@@ -260,40 +560,53 @@ class ContainerPerunAttribute(
     :func:`~Perun.perun_deserialize` must set not it to ``None`` but to an empty
     container. This eases the handling since no checks for ``None`` are needed.
 
-    In addition ``None`` cannot be used since we create a shallow copy of the attribute
-    once it has been serialized to be able to detect changes to its values; ``None`` has
-    no ``copy`` function but all several container data structures such as ``list``,
-    ``dict`` and ``set`` support it. Finally it allows to us skip defining a setter for
+    The deserialized container is stored as :class:`_TrackedDict` or
+    :class:`_TrackedList` which record any modification of their contents, ``None`` is
+    therefore not supported. Finally it allows to us skip defining a setter for
     :attr:`value` since only its contents are allowed to change.
     """
 
-    _value: CVT
-    _value_copy: CVT
+    __slots__ = ()
 
-    def __init_subclass__(cls, **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
+    _value: CVT
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._value_copy = self._value.copy()
+        if isinstance(self._value, (_TrackedDict, _TrackedList)):
+            return
+        if isinstance(self._value, dict):
+            self._value = _TrackedDict(self._value)
+        elif isinstance(self._value, list):
+            self._value = _TrackedList(self._value)
+        else:
+            raise AttributeError(
+                f"Value of container attribute must be a dict or list, not "
+                f"{type(self._value)}"
+            )
 
     @property
     def has_changed(self) -> bool:
         """
         Since the value of this attribute is a container the setter approach of the
-        superclass to detect changes does not work. Instead we compare the current
-        values with the initial ones.
+        superclass to detect changes does not work. Instead the container itself
+        records whether its contents have been modified.
         """
-        return self._value_copy != self._value
+        return self._value._dirty  # type: ignore
 
     @has_changed.setter
     def has_changed(self, value: bool) -> None:
         if not value:
             # reset changed indicator
-            self._value_copy = self._value.copy()
+            self._value._dirty = False  # type: ignore
             return
         raise ValueError("Manually setting to true not supported")
 
+    def _encoding_token(self) -> int:
+        """Only the contents of the container can change, which is tracked by the
+        container itself.
+        """
+        return self._value._version  # type: ignore
+
     @property
     def value(self) -> CVT:
         return self._value
@@ -26,6 +26,11 @@ class ConsistencyError(PerunBaseException):
     pass
 
 
+class AttributeNotExistsError(PerunBaseException):
+    "Python mapping of Perun's AttributeNotExistsException"
+    pass
+
+
 class RequestError(PerunBaseException):
     "Generic Exception in case no specific exception has been thrown"
     pass
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from asyncio import gather
+from itertools import chain
+from logging import DEBUG
 from typing import Any
+from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
@@ -26,6 +32,29 @@ from .resourcesManager import get_assigned_resources
 GTV = TypeVar("GTV", bound="Group")
 
 
+class _RequestPlan(NamedTuple):
+    """Everything :func:`Group.connect` needs to know about the
+    :class:`~os_credits.perun.base_attributes.PerunAttribute` of a group class to
+    request them, see :func:`Group._get_request_plan`.
+    """
+
+    friendly_to_attr: Dict[str, str]
+    """Mapping between the friendlyName of an attribute and the name used for it inside
+    the group.
+    """
+    regular_full_names: Tuple[str, ...]
+    """Full names of all requested attributes which are not resource bound."""
+    resource_bound_full_names: Tuple[str, ...]
+    """Full names of all requested resource bound attributes."""
+    regular_attr_names: Tuple[str, ...]
+    """Names used inside the group for all attributes which are not resource bound."""
+    resource_bound_attr_names: Tuple[str, ...]
+    """Names used inside the group for all resource bound attributes."""
+
+
+_REGISTERED_ATTRIBUTES = PerunAttribute.registered_attributes
+
+
 class Group:
     """
     Represents a Group object inside Perun.
@@ -36,6 +65,17 @@ class Group:
     fill the Attributes with information from Perun.
     """
 
+    __slots__ = (
+        "name",
+        "resource_id",
+        "assigned_resource",
+        "id",
+        "email",
+        "credits_granted",
+        "credits_used",
+        "credits_timestamps",
+    )
+
     name: str
     """Name of this group. Always set on instantiated objects since it is required by
     the constructor.
@@ -46,7 +86,12 @@ class Group:
     required by constructor.
     """
 
-    assigned_resource: Optional[bool] = None
+    _perun_attributes: ClassVar[Dict[str, Type[PerunAttribute[Any]]]]
+    _perun_attribute_names: ClassVar[FrozenSet[str]]
+    _perun_attribute_items: ClassVar[Tuple[Tuple[str, Type[PerunAttribute[Any]]], ...]]
+    _request_plan: ClassVar[_RequestPlan]
+
+    assigned_resource: Optional[bool]
     """Indicator whether this group is actually assigned to resource with
     ``resource_id``. Initially None, set to bool when :func:`connect` is called, but
     only if any of the annotated
@@ -76,6 +121,10 @@ class Group:
     :class:`~os_credits.perun.attributes.DenbiCreditTimestamps`.
     """
 
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._init_perun_attributes()
+
     def __init__(self, name: str, resource_id: int = 0) -> None:
         """
         Calling this method only creates the object, but does not query perun yet. Call
@@ -87,6 +136,7 @@ class Group:
         """
         self.name = name
         self.resource_id = resource_id
+        self.assigned_resource = None
 
     async def connect(self: GTV) -> GTV:
         """Retrieve all required values from *Perun* and populate the rest of the
@@ -108,7 +158,8 @@ class Group:
         #. All attributes of the group are retrieved by calling
            :func:`~os_credits.perun.attributesManager.get_attributes` and
            :func:`~os_credits.perun.attributesManager.get_resource_bound_attributes` if
-           necessary and stored inside this group.
+           necessary and stored inside this group. Both requests are performed
+           concurrently once the check above has succeeded.
 
         :return: Self, to allow chaining such as ``g=await Group([...]).connect()``
         :raises GroupResourceNotAssociatedError: In case group :attr:`name` is not
@@ -119,29 +170,13 @@ class Group:
         group_response = await get_group_by_name(self.name)
         self.id = int(group_response["id"])
 
-        # Mappings between the names of perun attributes needed for this instance and
-        # the friendlyName of the actual attributes
-        # friendlyName -> name_used_in_instance
-        friendly_name_to_group_attr_name: Dict[str, str] = {}
-
-        requested_attributes: List[str] = []
-        requested_resource_bound_attributes: List[str] = []
-
-        for (attr_name, attr_class) in type(self).get_perun_attributes().items():
-            friendly_name_to_group_attr_name[attr_class.friendlyName] = attr_name
-            if attr_class.is_resource_bound():
-                requested_resource_bound_attributes.append(attr_class.get_full_name())
-            else:
-                requested_attributes.append(attr_class.get_full_name())
-        # will hold the contents of all retrieved attributes
-        attributes: Dict[str, Dict[str, Any]] = {}
-        if requested_attributes:
-            for attr in await get_attributes(
-                self.id, attribute_full_names=requested_attributes
-            ):
-                attributes[attr["friendlyName"]] = attr
-
+        perun_attributes = type(self).get_perun_attributes()
+        request_plan = type(self)._get_request_plan()
+        requested_attributes = request_plan.regular_full_names
+        requested_resource_bound_attributes = request_plan.resource_bound_full_names
         if requested_resource_bound_attributes:
+            # do not request any resource bound attributes of a combination of group
+            # and resource which is invalid
             self.assigned_resource = await self.is_assigned_resource()
             if not self.assigned_resource:
                 raise GroupResourceNotAssociatedError(
@@ -149,19 +184,34 @@ class Group:
                     f"`{self.resource_id}` but resource bound attributes have been "
                     "requested "
                 )
-            for attr in await get_resource_bound_attributes(
-                self.id,
-                self.resource_id,
-                attribute_full_names=requested_resource_bound_attributes,
-            ):
-                attributes[attr["friendlyName"]] = attr
-        internal_logger.debug(
-            "Retrieved attributes Group %s: %s",
-            self,
-            {attr_name: attr["value"] for attr_name, attr in attributes.items()},
-        )
-        for friendly_name, group_attr_name in friendly_name_to_group_attr_name.items():
-            attr_class = type(self).get_perun_attributes()[group_attr_name]
+        # both kinds of attributes are independent of each other, request them
+        # concurrently
+        attribute_requests = []
+        if requested_attributes:
+            attribute_requests.append(
+                get_attributes(self.id, attribute_full_names=requested_attributes)
+            )
+        if requested_resource_bound_attributes:
+            attribute_requests.append(
+                get_resource_bound_attributes(
+                    self.id,
+                    self.resource_id,
+                    attribute_full_names=requested_resource_bound_attributes,
+                )
+            )
+        attribute_responses = await gather(*attribute_requests)
+        # will hold the contents of all retrieved attributes
+        attributes: Dict[str, Dict[str, Any]] = {}
+        for attr in chain.from_iterable(attribute_responses):
+            attributes[attr["friendlyName"]] = attr
+        if internal_logger.isEnabledFor(DEBUG):
+            internal_logger.debug(
+                "Retrieved attributes Group %s: %s",
+                self,
+                {attr_name: attr["value"] for attr_name, attr in attributes.items()},
+            )
+        for friendly_name, group_attr_name in request_plan.friendly_to_attr.items():
+            attr_class = perun_attributes[group_attr_name]
 
             try:
                 setattr(self, group_attr_name, attr_class(**attributes[friendly_name]))
@@ -178,10 +228,9 @@ class Group:
         Does so by testing whether :attr:`resource_id` is part of the response of
         :func:`~os_credits.perun.resourcesManager.get_assigned_resources`
         """
-        # using a generator expression saves time
-        return self.resource_id in (
+        return self.resource_id in {
             resource["id"] for resource in await get_assigned_resources(self.id)
-        )
+        }
 
     async def save(self, _save_all: bool = False) -> None:
         """Collects all annotated
@@ -195,31 +244,41 @@ class Group:
             actually changed since retrieval. Also used for testing.
         """
         internal_logger.debug("Save of Group %s called", self)
-        changed_attrs: List[PerunAttribute[Any]] = []
-        changed_resource_bound_attrs: List[PerunAttribute[Any]] = []
-        # collect all attributes whose value has changed since retrieval
-        for attribute_name in type(self).get_perun_attributes():
-            attr = getattr(self, attribute_name)
-            # save all attributes in offline/dummy since we will not get non-stored back
-            # from Perun
-            if attr.has_changed or _save_all:
-                if not attr.is_resource_bound():
-                    changed_attrs.append(attr)
-                else:
-                    changed_resource_bound_attrs.append(attr)
-        if changed_attrs:
+        request_plan = type(self)._get_request_plan()
+        regular_attrs: List[PerunAttribute[Any]] = [
+            getattr(self, attribute_name)
+            for attribute_name in request_plan.regular_attr_names
+        ]
+        resource_bound_attrs: List[PerunAttribute[Any]] = [
+            getattr(self, attribute_name)
+            for attribute_name in request_plan.resource_bound_attr_names
+        ]
+        # only attributes whose value has changed since retrieval are sent, save all
+        # attributes in offline/dummy since we will not get non-stored back from Perun
+        only_changed = not _save_all
+        # both kinds of attributes are stored independently of each other, send them
+        # concurrently
+        save_requests = []
+        if _save_all or any(attr.has_changed for attr in regular_attrs):
             internal_logger.debug(
-                "Sending modified regular attributes to perun %s", changed_attrs
+                "Sending modified regular attributes to perun %s", regular_attrs
+            )
+            save_requests.append(
+                set_attributes(self.id, regular_attrs, only_changed=only_changed)
             )
-            await set_attributes(self.id, changed_attrs)
-        if changed_resource_bound_attrs:
+        if _save_all or any(attr.has_changed for attr in resource_bound_attrs):
             if getattr(self, "assigned_resource", False):
                 internal_logger.debug(
                     "Sending modified resource bound attributes to perun %s",
-                    changed_resource_bound_attrs,
+                    resource_bound_attrs,
                 )
-                await set_resource_bound_attributes(
-                    self.id, self.resource_id, changed_resource_bound_attrs
+                save_requests.append(
+                    set_resource_bound_attributes(
+                        self.id,
+                        self.resource_id,
+                        resource_bound_attrs,
+                        only_changed=only_changed,
+                    )
                 )
             else:
                 internal_logger.warning(
@@ -229,13 +288,14 @@ class Group:
                     self.name,
                     self.resource_id,
                 )
+        await gather(*save_requests)
 
     def __repr__(self) -> str:
         # in case Group has not been connected yet
         if getattr(self, "id", None) is None:
             return f"Group({self.name},{self.resource_id})"
         param_repr: List[str] = []
-        for attribute in type(self).get_perun_attributes():
+        for attribute, _ in type(self)._perun_attribute_items:
             param_repr.append(f"{attribute}={repr(self.__getattribute__(attribute))}")
 
         # using square instead of regular brackets to indicate that you cannot copy
@@ -246,7 +306,7 @@ class Group:
         return f"{self.name}@{self.resource_id}"
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in type(self).get_perun_attributes() and not isinstance(
+        if name in type(self)._perun_attribute_names and not isinstance(
             value, PerunAttribute
         ):
             raise AttributeError(
@@ -256,24 +316,79 @@ class Group:
         object.__setattr__(self, name, value)
 
     @classmethod
-    @lru_cache()
     def get_perun_attributes(cls) -> Dict[str, Type[PerunAttribute[Any]]]:
         """
         Return all class attributes which are annotated with subclasses of
         :class:`~os_credits.perun.base_attributes.PerunAttribute`.
 
-        Since the content of the response cannot change at runtime a
-        :func:`~functools.lru_cache` is used.
+        Since the content of the response cannot change at runtime it is computed once
+        per class by :func:`_compute_perun_attributes` and stored on the class itself.
 
         :return: Dictionary of the attribute names of this class and the corresponding
             :class:`~os_credits.perun.base_attributes.PerunAttribute` subclass.
         """
+        # look inside the class' own namespace, a subclass must not use the attributes
+        # cached for its parent
+        perun_attributes = cls.__dict__.get("_perun_attributes")
+        if perun_attributes is None:
+            perun_attributes = cls._init_perun_attributes()
+        return perun_attributes
+
+    @classmethod
+    def _init_perun_attributes(cls) -> Dict[str, Type[PerunAttribute[Any]]]:
+        """Compute the attributes returned by :func:`get_perun_attributes` and store
+        them, their names and items on the class, for the hot paths such as
+        :func:`__setattr__` which cannot afford a method call.
+
+        Called for :class:`Group` once this module is loaded and for every subclass on
+        creation.
+        """
+        perun_attributes = cls._compute_perun_attributes()
+        cls._perun_attributes = perun_attributes
+        cls._perun_attribute_names = frozenset(perun_attributes)
+        cls._perun_attribute_items = tuple(perun_attributes.items())
+        return perun_attributes
+
+    @classmethod
+    def _get_request_plan(cls) -> _RequestPlan:
+        """Determine which attributes :func:`connect` has to request and :func:`save`
+        has to send, split by whether they are resource bound. Computed once per class
+        and stored on it.
+        """
+        request_plan = cls.__dict__.get("_request_plan")
+        if request_plan is None:
+            # Mappings between the names of perun attributes needed for this instance
+            # and the friendlyName of the actual attributes
+            # friendlyName -> name_used_in_instance
+            friendly_to_attr: Dict[str, str] = {}
+            regular_full_names: List[str] = []
+            resource_bound_full_names: List[str] = []
+            regular_attr_names: List[str] = []
+            resource_bound_attr_names: List[str] = []
+            for attr_name, attr_class in cls.get_perun_attributes().items():
+                friendly_to_attr[attr_class.friendlyName] = attr_name
+                if attr_class.is_resource_bound():
+                    resource_bound_full_names.append(attr_class.get_full_name())
+                    resource_bound_attr_names.append(attr_name)
+                else:
+                    regular_full_names.append(attr_class.get_full_name())
+                    regular_attr_names.append(attr_name)
+            request_plan = _RequestPlan(
+                friendly_to_attr,
+                tuple(regular_full_names),
+                tuple(resource_bound_full_names),
+                tuple(regular_attr_names),
+                tuple(resource_bound_attr_names),
+            )
+            cls._request_plan = request_plan
+        return request_plan
+
+    @classmethod
+    def _compute_perun_attributes(cls) -> Dict[str, Type[PerunAttribute[Any]]]:
         attributes = {}
         for attr_name, attr_class_name in cls.__annotations__.items():
             try:
-                attributes[attr_name] = PerunAttribute.registered_attributes[
-                    attr_class_name
-                ]
+                attributes[attr_name] = _REGISTERED_ATTRIBUTES[attr_class_name]
                 internal_logger.debug(
                     "Connected group attribute `%s` with PerunAttribute `%s`",
                     attr_name,
@@ -283,3 +398,6 @@ class Group:
                 # this will fail for any non-Perun attribute, such as name or id
                 pass
         return attributes
+
+
+Group._init_perun_attributes()
@@ -1,18 +1,28 @@
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
 from contextvars import ContextVar
 from typing import Any
 from typing import Dict
 from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from aiohttp import BasicAuth
 from aiohttp import ClientSession
+from aiohttp import TCPConnector
+from orjson import dumps
+from orjson import loads
 
 from os_credits.log import requests_logger
 from os_credits.settings import config
 
+from .exceptions import AttributeNotExistsError
 from .exceptions import BadCredentialsException
 from .exceptions import ConsistencyError
 from .exceptions import GroupNotExistsError
 from .exceptions import InternalError
+from .exceptions import PerunBaseException
 from .exceptions import RequestError
 
 # will be instantiated/set it in the context of the aiohttp.web.application on
@@ -21,51 +31,155 @@ client_session: ContextVar[ClientSession] = ContextVar("client_session")
 
 RPC_BASE_URL = "https://perun.elixir-czech.cz/krb/rpc/json"
 
+# Python mappings of the exceptions returned by Perun, anything else is raised as
+# :class:`~os_credits.perun.exceptions.RequestError`
+_PERUN_EXCEPTIONS: Dict[str, Type[PerunBaseException]] = {
+    "GroupNotExistsException": GroupNotExistsError,
+    "InternalErrorException": InternalError,
+    "ConsistencyErrorException": ConsistencyError,
+    "AttributeNotExistsException": AttributeNotExistsError,
+}
 
-async def perun_set(url: str, params: Optional[Dict[str, Any]] = None) -> None:
-    await _perun_rpc(url, params)
+# request bodies are encoded by ourselves, see :func:`_perun_rpc`
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# session used when running outside of the application, together with the event loop
+# it belongs to, see :func:`_get_fallback_session`
+_fallback_session: Optional[Tuple[AbstractEventLoop, ClientSession]] = None
+# session of the application last used together with its event loop, see
+# :func:`_get_session`
+_cached_session: Optional[Tuple[AbstractEventLoop, ClientSession]] = None
+
+
+def _json_serialize(obj: Any) -> str:
+    """orjson based replacement for :func:`json.dumps` used by :class:`ClientSession`
+    in case any request is made with the ``json`` parameter.
+    """
+    return dumps(obj).decode()
+
+
+def create_perun_session() -> ClientSession:
+    """Create a session to communicate with *Perun*, authenticated with the credentials
+    from the :ref:`Settings`.
+
+    Connections are kept alive and DNS responses cached since all requests go to the
+    same host. JSON is encoded with orjson, just like :func:`_perun_rpc` does.
+    """
+    return ClientSession(
+        auth=BasicAuth(
+            config["OS_CREDITS_PERUN_LOGIN"], config["OS_CREDITS_PERUN_PASSWORD"]
+        ),
+        connector=TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+        json_serialize=_json_serialize,
+    )
+
+
+def _get_fallback_session() -> ClientSession:
+    """Return the session used in case we are not running inside the application, i.e.
+    inside an ipython console for testing purposes. Created on first use and reused
+    afterwards as long as it is open and the event loop did not change.
+
+    No lock needed since nothing is awaited between checking for and creating the
+    session.
+    """
+    global _fallback_session
+    loop = get_running_loop()
+    if (
+        _fallback_session is None
+        or _fallback_session[0] is not loop
+        or _fallback_session[1].closed
+    ):
+        _fallback_session = (loop, create_perun_session())
+    return _fallback_session[1]
+
+
+def _get_session() -> ClientSession:
+    """Return the session of the application, stored inside :data:`client_session`,
+    or the one of :func:`_get_fallback_session` if there is none.
+
+    The context variable is always consulted, so every context, e.g. a second
+    application or a test running on the same event loop, uses its own session. The
+    cache only remembers the event loop the session was first used on, a session of
+    another loop or one which has already been closed is never used.
+    """
+    global _cached_session
+    session = client_session.get(None)
+    if session is None or session.closed:
+        return _get_fallback_session()
+    loop = get_running_loop()
+    if _cached_session is None or _cached_session[1] is not session:
+        _cached_session = (loop, session)
+    elif _cached_session[0] is not loop:
+        return _get_fallback_session()
+    return session
+
+
+async def close_fallback_session() -> None:
+    """Close the session created by :func:`_get_fallback_session`, if any."""
+    global _fallback_session
+    if _fallback_session is not None:
+        await _fallback_session[1].close()
+        _fallback_session = None
+
+
+async def perun_set(
+    url: str, params: Optional[Union[Dict[str, Any], bytes]] = None
+) -> None:
+    """
+    :param params: Parameters of the call, either as dictionary or already JSON
+        encoded.
+    """
+    response_body = await _perun_rpc(url, params)
+    # successful calls of setters do not return any content, only errors have to be
+    # decoded
+    if not response_body or response_body == b"null":
+        return
+    _decode_response(response_body)
 
 
 async def perun_get(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
-    return await _perun_rpc(url, params)
+    return _decode_response(await _perun_rpc(url, params))
 
 
-async def _perun_rpc(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+async def _perun_rpc(
+    url: str, params: Optional[Union[Dict[str, Any], bytes]] = None
+) -> bytes:
+    """Send the request and return the raw body of the response, decoding it is left
+    to :func:`_decode_response` since it is often not needed when setting values.
+    """
     request_url = f"{RPC_BASE_URL}/{url}"
     requests_logger.debug(
         "Sending POST request `%s` with data `%s`", request_url, params
     )
-    try:
-        _client = client_session.get()
-    except LookupError:
-        # in case of not running inside the application, i.e. inside an ipython console
-        # for testing purposes
-        # not nice to create a new session per request but ok for testing
-        _client = ClientSession(
-            auth=BasicAuth(
-                config["OS_CREDITS_PERUN_LOGIN"], config["OS_CREDITS_PERUN_PASSWORD"]
-            )
-        )
+    _client = _get_session()
 
-    async with _client.post(request_url, json=params) as response:
+    # encode/decode with orjson instead of the stdlib json module used by aiohttp
+    async with _client.post(
+        request_url,
+        data=params if params is None or isinstance(params, bytes) else dumps(params),
+        headers=_JSON_HEADERS,
+    ) as response:
         if response.status == 401:
             raise BadCredentialsException(
                 "Perun returned 'Unauthorized' status code for user "
                 f"`{config['OS_CREDITS_PERUN_LOGIN']}`."
             )
-        response_content = await response.json()
+        response_body = await response.read()
         requests_logger.debug(
-            "Received response %r with content %r", response, response_content
+            "Received response %r with content %r", response, response_body
         )
-        if response_content and "errorId" in response_content:
-            # Some kind of error has occured
-            if response_content["name"] == "GroupNotExistsException":
-                raise GroupNotExistsError(response_content["message"])
-            elif response_content["name"] == "InternalErrorException":
-                raise InternalError(response_content["message"])
-            elif response_content["name"] == "ConsistencyErrorException":
-                raise ConsistencyError(response_content["message"])
-            else:
-                raise RequestError(response_content["message"])
-
-        return response_content
+        return response_body
+
+
+def _decode_response(response_body: bytes) -> Any:
+    """Decode the body of a response and raise the matching exception in case *Perun*
+    reported an error.
+    """
+    response_content = loads(response_body) if response_body.strip() else None
+    if response_content and "errorId" in response_content:
+        # Some kind of error has occured
+        raise _PERUN_EXCEPTIONS.get(response_content["name"], RequestError)(
+            response_content["message"]
+        )
+
+    return response_content
@@ -1,23 +1,28 @@
-"""All settings can be set/overwritten by environment variables of the same name. They
-are set when the :mod:`os_credits.settings` module is loaded.
-
-The settings can be accessed via the :attr:`config` dictionary which is a
-:class:`collections.ChainMap` containing the parsed and processed environment variables,
-the default config values and a special dictionary :class:`_EmptyConfig` whose only
-purpose is to log any access to non existing settings and raise a
-:exc:`~os_credits.exceptions.MissingConfigError`.
+"""All settings can be set/overwritten by environment variables of the same name. The
+environment is read when the :mod:`os_credits.settings` module is loaded, the settings
+are parsed on first access.
+
+The settings can be accessed via the :attr:`config` dictionary which is built once by
+merging the default config values, the environment variables and the parsed and
+processed environment variables, in this order. Any access to non existing settings is
+logged and raises a :exc:`~os_credits.exceptions.MissingConfigError`, see
+:class:`_Config`.
 """
 
 from __future__ import annotations
 
-from collections import ChainMap
-from collections import UserDict
 from decimal import Decimal
+from functools import lru_cache
 from os import environ
+from sys import intern
+from types import MappingProxyType
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Mapping
 from typing import Optional
-from typing import Set
+from typing import Tuple
 from typing import cast
 
 from mypy_extensions import TypedDict
@@ -161,123 +166,191 @@ class Config(TypedDict):
     OS_CREDITS_PERUN_PASSWORD: str
     OS_CREDITS_PERUN_VO_ID: int
     OS_CREDITS_PRECISION: Decimal
-    OS_CREDITS_PROJECT_WHITELIST: Optional[Set[str]]
+    OS_CREDITS_PROJECT_WHITELIST: Optional[FrozenSet[str]]
     OS_CREDITS_WORKERS: int
 
 
-default_config = Config(
-    CLOUD_GOVERNANCE_MAIL="",
-    CREDITS_HISTORY_DB="credits_history",
-    INFLUXDB_DB="",
-    INFLUXDB_HOST="localhost",
-    INFLUXDB_PORT=8086,
-    INFLUXDB_USER="",
-    INFLUXDB_USER_PASSWORD="",
-    MAIL_FROM="CreditsService@denbi.de",
-    MAIL_NOT_STARTTLS=False,
-    MAIL_SMTP_PASSWORD="",
-    MAIL_SMTP_PORT=25,
-    MAIL_SMTP_SERVER="localhost",
-    MAIL_SMTP_USER="",
-    NOTIFICATION_TO_OVERWRITE="",
-    OS_CREDITS_PERUN_LOGIN="",
-    OS_CREDITS_PERUN_PASSWORD="",
-    OS_CREDITS_PERUN_VO_ID=0,
-    OS_CREDITS_PRECISION=Decimal(10) ** -2,
-    OS_CREDITS_PROJECT_WHITELIST=None,
-    OS_CREDITS_WORKERS=10,
+@lru_cache(maxsize=16)
+def _precision_quantum(decimal_places: int) -> Decimal:
+    """Return ``10 ** -decimal_places`` as :class:`~decimal.Decimal`, built directly
+    from its tuple representation instead of going through the power operator.
+    """
+    return Decimal((0, (1,), -decimal_places))
+
+
+# read-only, the config falls back to it for deleted settings
+default_config: Mapping[str, Any] = MappingProxyType(
+    Config(
+        CLOUD_GOVERNANCE_MAIL="",
+        CREDITS_HISTORY_DB="credits_history",
+        INFLUXDB_DB="",
+        INFLUXDB_HOST="localhost",
+        INFLUXDB_PORT=8086,
+        INFLUXDB_USER="",
+        INFLUXDB_USER_PASSWORD="",
+        MAIL_FROM="CreditsService@denbi.de",
+        MAIL_NOT_STARTTLS=False,
+        MAIL_SMTP_PASSWORD="",
+        MAIL_SMTP_PORT=25,
+        MAIL_SMTP_SERVER="localhost",
+        MAIL_SMTP_USER="",
+        NOTIFICATION_TO_OVERWRITE="",
+        OS_CREDITS_PERUN_LOGIN="",
+        OS_CREDITS_PERUN_PASSWORD="",
+        OS_CREDITS_PERUN_VO_ID=0,
+        OS_CREDITS_PRECISION=_precision_quantum(2),
+        OS_CREDITS_PROJECT_WHITELIST=None,
+        OS_CREDITS_WORKERS=10,
+    )
 )
 
 
+# the environment is read once when this module is loaded, or by :func:`reset_config`,
+# and never modified by us
+_ENV_SNAPSHOT: Dict[str, str] = dict(environ)
+
+
+def _parse_whitelist(value: str) -> FrozenSet[str]:
+    # interned since the names of all incoming projects are tested against it
+    return frozenset(intern(project_name) for project_name in value.split(";"))
+
+
+def _parse_flag(value: str) -> bool:
+    # flags are set if the variable is present, regardless of its value
+    return True
+
+
+def _parse_non_negative_int(value: str) -> int:
+    int_value = int(value)
+    if int_value < 0:
+        raise ValueError("Integer value must not be negative")
+    return int_value
+
+
+def _parse_precision(value: str) -> Decimal:
+    return _precision_quantum(_parse_non_negative_int(value))
+
+
+# settings which have to be processed by :func:`parse_config_from_environment` before
+# they can be used, together with their parser, their raw values from the environment
+# are never used
+_PARSERS: Tuple[Tuple[str, Callable[[str], Any]], ...] = (
+    ("OS_CREDITS_PROJECT_WHITELIST", _parse_whitelist),
+    ("MAIL_NOT_STARTTLS", _parse_flag),
+    ("OS_CREDITS_PRECISION", _parse_precision),
+    ("OS_CREDITS_WORKERS", _parse_non_negative_int),
+    ("INFLUXDB_PORT", _parse_non_negative_int),
+    ("OS_CREDITS_PERUN_VO_ID", _parse_non_negative_int),
+    ("MAIL_SMTP_PORT", _parse_non_negative_int),
+)
+_PROCESSED_KEYS = frozenset(key for key, _ in _PARSERS)
+
+
 def parse_config_from_environment() -> Config:
     # for environment variables that need to be processed
     PROCESSED_ENV_CONFIG: Dict[str, Any] = {}
 
-    try:
-        PROCESSED_ENV_CONFIG.update(
-            {
-                "OS_CREDITS_PROJECT_WHITELIST": set(
-                    environ["OS_CREDITS_PROJECT_WHITELIST"].split(";")
-                )
-            }
-        )
-    except KeyError:
-        # Environment variable not set, that's ok
-        pass
-    for bool_value in ["MAIL_NOT_STARTTLS"]:
-        if bool_value in environ:
-            PROCESSED_ENV_CONFIG.update({bool_value: True})
-
-    for int_value_key in [
-        "OS_CREDITS_PRECISION",
-        "OS_CREDITS_WORKERS",
-        "INFLUXDB_PORT",
-        "OS_CREDITS_PERUN_VO_ID",
-        "MAIL_SMTP_PORT",
-    ]:
-        try:
-            int_value = int(environ[int_value_key])
-            if int_value < 0:
-                internal_logger.warning(
-                    "Integer value (%s) must not be negative, falling back to default "
-                    "value",
-                    int_value_key,
-                )
-                del environ[int_value_key]
-                continue
-            PROCESSED_ENV_CONFIG.update({int_value_key: int_value})
-            internal_logger.debug(f"Added {int_value_key} to procssed env")
-        except KeyError:
+    for key, parser in _PARSERS:
+        value = _ENV_SNAPSHOT.get(key)
+        if value is None:
             # Environment variable not set, that's ok
-            pass
-        except ValueError:
+            continue
+        try:
+            PROCESSED_ENV_CONFIG[key] = parser(value)
+        except ValueError as e:
+            # the raw value is not used either, see :func:`_build_config`, therefore
+            # the default value applies
             internal_logger.warning(
-                "Could not convert value of $%s('%s') to int",
-                int_value_key,
-                environ[int_value_key],
+                "Could not parse value of $%s('%s'), falling back to default value: %s",
+                key,
+                value,
+                e,
             )
-            # since we cannot use a subset of the actual environment, see below, we have
-            # to remove invalid keys from environment to make sure that if such a key is
-            # looked up inside the config the chainmap does not return the unprocessed
-            # value from the environment but rather the default one
-            del environ[int_value_key]
-
-    if "OS_CREDITS_PRECISION" in PROCESSED_ENV_CONFIG:
-        PROCESSED_ENV_CONFIG["OS_CREDITS_PRECISION"] = (
-            Decimal(10) ** -PROCESSED_ENV_CONFIG["OS_CREDITS_PRECISION"]
-        )
+            continue
+        internal_logger.debug("Added %s to processed env", key)
 
-    # this would be the right way but makes pytest hang forever -.-'
-    # use the workaround explained above and add the raw process environment to the
-    # chainmap although this is not really nice :(
-    # At least mypy should show an error whenever a config value not defined in
-    # :class:`Config` is accessed
-
-    # for key in Config.__annotations__:
-    #    # every value which needs processing should already be present in
-    #    # PROCESSED_ENV_CONFIG if set in the environment
-    #    if key in PROCESSED_ENV_CONFIG:
-    #        continue
-    #    if key in environ:
-    #        PROCESSED_ENV_CONFIG.update({key: environ[key]})
     return cast(Config, PROCESSED_ENV_CONFIG)
 
 
-class _EmptyConfig(UserDict):
-    """
-    Used as last element inside the config chainmap. If its :func:`__getitem__` method
-    is called the requested value is not available and we have to exit.
+class _Config(dict):
+    """Flattened configuration, a single dictionary lookup per setting. Only if a
+    setting is missing, i.e. it has been deleted, :func:`__missing__` falls back to its
+    default value. If there is none we have to exit.
     """
 
-    def __getitem__(self, key):
-        internal_logger.exception(
-            "Config value %s was requested but not known. Appending stacktrace", key
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> Any:
+        try:
+            return default_config[key]
+        except KeyError:
+            pass
+        # not inside an exception handler, therefore log the current stack
+        internal_logger.error(
+            "Config value %s was requested but not known. Appending stacktrace",
+            key,
+            stack_info=True,
         )
         raise MissingConfigError(f"Missing value for key {key}")
 
 
-config = cast(
-    Config,
-    # once the problem with pytest is resolved remove `environ` from this list
-    ChainMap(parse_config_from_environment(), environ, default_config, _EmptyConfig()),
-)
+def _build_config() -> Dict[str, Any]:
+    """Merge the default values, the raw values of all unprocessed settings from the
+    environment and the processed ones, later ones take precedence.
+    """
+    return {
+        **default_config,
+        **{
+            key: _ENV_SNAPSHOT[key]
+            for key in Config.__annotations__
+            if key in _ENV_SNAPSHOT and key not in _PROCESSED_KEYS
+        },
+        **parse_config_from_environment(),
+    }
+
+
+def get_config() -> Config:
+    """Return the configuration, built on first access.
+
+    Also available as :attr:`config` attribute of this module, which is what most of
+    the code uses.
+    """
+    global _config
+    if _config is None:
+        _config = _Config(_build_config())
+    return cast(Config, _config)
+
+
+def reset_config() -> None:
+    """Rebuild the configuration from the current process environment, i.e. after it
+    has been modified by the tests.
+
+    The existing object is updated in place so that every module which imported
+    :attr:`config` sees the new values.
+    """
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = dict(environ)
+    if _config is None:
+        get_config()
+        return
+    _config.clear()
+    _config.update(_build_config())
+
+
+config: Config
+"""The configuration, see :func:`get_config`."""
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562, allows ``from os_credits.settings import config`` without building the
+    # configuration on import of this module
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# reuse the existing object when the module is reloaded, so that modules which imported
+# it see the new values
+_config: Optional[_Config] = globals().get("_config")
+if _config is not None:
+    reset_config()
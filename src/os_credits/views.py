@@ -4,19 +4,22 @@ setup.
 The endpoint can also be explored via the *Swagger UI*, usually ``/api/doc``.
 """
 import logging.config
+import re
+from asyncio import Task
 from datetime import datetime
 from decimal import Decimal
-from json import JSONDecodeError
-from json import loads
+from time import monotonic
 from traceback import format_stack
 from typing import Any
 from typing import Dict
-from typing import List
 from typing import Optional
-from typing import Union
+from typing import Tuple
 
 from aiohttp import web
 from aiohttp_jinja2 import template
+from orjson import JSONDecodeError
+from orjson import dumps
+from orjson import loads
 
 from os_credits.credits.base_models import Metric
 from os_credits.influx.client import InfluxDBClient
@@ -25,6 +28,19 @@ from os_credits.log import internal_logger
 from os_credits.settings import config
 
 
+def _json_response(data: Any) -> web.Response:
+    """Replacement of :func:`aiohttp.web.json_response` which encodes ``data`` with
+    orjson instead of the stdlib :mod:`json` module.
+    """
+    return web.Response(body=dumps(data), content_type="application/json")
+
+
+# accepts any name containing at least one non-whitespace character, except for
+# '{project_name}' which Swagger UI sends if none is specified -.-', to be used with
+# ``fullmatch``
+_PROJECT_NAME_RE = re.compile(r"(?!\{project_name\}\Z)\s*\S.*", re.DOTALL)
+
+
 async def ping(_: web.Request) -> web.Response:
     """
     Simple ping endpoint to be able to determine whether the application is up and
@@ -127,17 +143,17 @@ async def credits_history_api(request: web.Request) -> web.Response:
         raise web.HTTPBadRequest(
             reason="``start_date`` must be older than ``end_date``."
         )
-    try:
-        project_name = request.match_info["project_name"]
-        # Swagger UI sends '{project_name}' if none is specified -.-'
-        if project_name == "{project_name}" or not project_name.strip():
-            raise KeyError
-    except KeyError:
+    project_name = request.match_info.get("project_name", "")
+    if not _PROJECT_NAME_RE.fullmatch(project_name):
         raise web.HTTPBadRequest(reason="No non-empty ``project_name`` provided")
     influx_client: InfluxDBClient = request.app["influx_client"]
-    time_column = ["timestamps"]
-    credits_column: List[Union[str, float]] = ["credits"]
-    metric_column = ["metrics"]
+    # the columns are encoded while iterating, which keeps only the encoded JSON and
+    # no python objects per point in memory, closed when assembling the response
+    time_column = bytearray(b'["timestamps"')
+    credits_column = bytearray(b'["credits"')
+    metric_column = bytearray(b'["metrics"')
+    # only a handful of different metrics, encode each of their names only once
+    encoded_metric_names: Dict[str, bytes] = {}
     result = await influx_client.query_billing_history(project_name, since=start_date)
     try:
         async for point in result:
@@ -145,19 +161,35 @@ async def credits_history_api(request: web.Request) -> web.Response:
             if end_date:
                 if point.timestamp > end_date:
                     continue
-            time_column.append(point.timestamp.strftime(datetime_format))
-            credits_column.append(float(point.credits_left))
-            metric_column.append(point.metric_friendly_name)
+            timestamp = point.timestamp
+            # equals ``datetime_format``, without the overhead of ``strftime``
+            time_column += b',"%04d-%02d-%02d %02d:%02d:%02d"' % (
+                timestamp.year,
+                timestamp.month,
+                timestamp.day,
+                timestamp.hour,
+                timestamp.minute,
+                timestamp.second,
+            )
+            credits_column += b",%s" % dumps(float(point.credits_left))
+            metric_name = point.metric_friendly_name
+            try:
+                metric_column += encoded_metric_names[metric_name]
+            except KeyError:
+                encoded_metric_names[metric_name] = b",%s" % dumps(metric_name)
+                metric_column += encoded_metric_names[metric_name]
     except InfluxDBError:
         raise web.HTTPBadRequest(reason="Invalid project name")
     # check whether any data were retrieved
-    if credits_column == ["credits"]:
+    if credits_column == b'["credits"':
         # let's check whether the project has history at all
         if await influx_client.project_has_history(project_name):
             raise web.HTTPNoContent(reason="Try changing *_date parameters")
         raise web.HTTPNotFound(reason="No data available for given parameters.")
-    return web.json_response(
-        {"timestamps": time_column, "credits": credits_column, "metrics": metric_column}
+    return web.Response(
+        body=b'{"timestamps":%s],"credits":%s],"metrics":%s]}'
+        % (time_column, credits_column, metric_column),
+        content_type="application/json",
     )
 
 
@@ -200,18 +232,65 @@ async def influxdb_write(request: web.Request) -> web.Response:
         description: A corresponding task object will be created. See application log
           for further information
     """  # noqa (cannot fix long url)
-    # .text() performs automatic decoding from bytes
-    influxdb_lines = await request.text()
     # an unknown number of lines will be send, put them all into the queue
-    for influx_line in influxdb_lines.splitlines():
-        await request.app["task_queue"].put(influx_line)
-        internal_logger.debug(
-            "Put %s into queue (%s elements)",
-            influx_line,
-            request.app["task_queue"].qsize(),
-        )
+    task_queue = request.app["task_queue"]
+    debug_enabled = internal_logger.isEnabledFor(logging.DEBUG)
+    # read the body line by line while it arrives instead of decoding it as a whole,
+    # ``splitlines`` removes the line ending, whether ``\n`` or ``\r\n``, and splits at
+    # the same boundaries as if applied to the whole body
+    async for raw_line in request.content:
+        for influx_line in raw_line.decode().splitlines():
+            # the queue is unbounded, no need to yield to the event loop for every line
+            task_queue.put_nowait(influx_line)
+            if debug_enabled:
+                internal_logger.debug(
+                    "Put %s into queue (%s elements)", influx_line, task_queue.qsize()
+                )
     # always answer 202
-    return web.HTTPAccepted()
+    return web.Response(status=202)
+
+
+# values of the ``verbose`` parameter of :func:`application_stats` which do not request
+# the extended information, ``None`` if it is missing
+_NOT_VERBOSE = frozenset({None, "", "false"})
+
+
+# seconds for which the extended information of :func:`application_stats` is reused
+_VERBOSE_STATS_MAX_AGE = 2.0
+
+
+def _format_current_frame(task: Task) -> str:
+    """Format only the frame the given task is currently suspended at, instead of its
+    whole stack.
+    """
+    frames = task.get_stack(limit=1)
+    if not frames:
+        # task has already finished
+        return ""
+    return format_stack(frames[0], limit=1)[0]
+
+
+def _get_verbose_stats(app: web.Application) -> Dict[str, Any]:
+    """Return the extended information of :func:`application_stats`.
+
+    Formats the current frame of every worker and the state of every group lock, which
+    grows with the number of billed projects, therefore the result is reused for
+    :data:`_VERBOSE_STATS_MAX_AGE` seconds.
+    """
+    cache = app["verbose_stats_cache"]
+    now = monotonic()
+    if "stats" not in cache or now - cache["created"] > _VERBOSE_STATS_MAX_AGE:
+        cache["stats"] = {
+            "task_stacks": {
+                name: _format_current_frame(task)
+                for name, task in app["task_workers"].items()
+            },
+            "group_locks": {
+                key: repr(lock) for key, lock in app["group_locks"].items()
+            },
+        }
+        cache["created"] = now
+    return cache["stats"]
 
 
 async def application_stats(request: web.Request) -> web.Response:
@@ -274,32 +353,18 @@ async def application_stats(request: web.Request) -> web.Response:
         "number_of_locks": len(request.app["group_locks"]),
         "uptime": str(datetime.now() - request.app["start_time"]),
     }
-    if (
-        "verbose" in request.query
-        and request.query["verbose"]
-        and request.query["verbose"] != "false"
-    ):
-        stats.update(
-            {
-                "task_stacks": {
-                    name: [format_stack(stack)[0] for stack in task.get_stack()][0]
-                    for name, task in request.app["task_workers"].items()
-                },
-                "group_locks": {
-                    key: repr(lock) for key, lock in request.app["group_locks"].items()
-                },
-            }
-        )
-    return web.json_response(stats)
+    if request.query.get("verbose") not in _NOT_VERBOSE:
+        stats.update(_get_verbose_stats(request.app))
+    return _json_response(stats)
 
 
 async def update_logging_config(request: web.Request) -> web.Response:
     """
     Possibility to update logging configuration without restart
     """
-    logging_json_text = await request.text()
     try:
-        logging_config = loads(logging_json_text)
+        # orjson parses the raw bytes, no need to decode the body first
+        logging_config = loads(await request.read())
     except JSONDecodeError as e:
         raise web.HTTPBadRequest(reason=str(e))
     try:
@@ -309,6 +374,11 @@ async def update_logging_config(request: web.Request) -> web.Response:
     raise web.HTTPNoContent()
 
 
+# serialized response of :func:`get_metrics` and the number of registered metrics it has
+# been built for, metrics are only ever added but possibly after this module is imported
+_metric_information: Tuple[int, bytes] = (-1, b"")
+
+
 # Usage of class-based views would be nicer, unfortunately not yet supported by
 # aiohttp-swagger
 async def get_metrics(_: web.Request) -> web.Response:
@@ -348,11 +418,18 @@ async def get_metrics(_: web.Request) -> web.Response:
                   type: str
                   description: Human readable name of the metric.
     """
-    metric_information = {
-        friendly_name: metric.api_information()
-        for friendly_name, metric in Metric.metrics_by_friendly_name.items()
-    }
-    return web.json_response(metric_information)
+    global _metric_information
+    metrics_by_friendly_name = Metric.metrics_by_friendly_name
+    number_of_metrics, body = _metric_information
+    if number_of_metrics != len(metrics_by_friendly_name):
+        body = dumps(
+            {
+                friendly_name: metric.api_information()
+                for friendly_name, metric in metrics_by_friendly_name.items()
+            }
+        )
+        _metric_information = (len(metrics_by_friendly_name), body)
+    return web.Response(body=body, content_type="application/json")
 
 
 async def costs_per_hour(request: web.Request) -> web.Response:
@@ -388,21 +465,22 @@ async def costs_per_hour(request: web.Request) -> web.Response:
           type: float
     """
     try:
-        machine_specs = await request.json()
+        machine_specs = loads(await request.read())
     except JSONDecodeError:
         raise web.HTTPBadRequest(reason="Invalid JSON")
+    metrics_by_friendly_name = Metric.metrics_by_friendly_name
     costs_per_hour = Decimal(0)
     for friendly_name, spec in machine_specs.items():
         try:
-            costs_per_hour += Metric.metrics_by_friendly_name[
-                friendly_name
-            ].costs_per_hour(spec)
+            costs_per_hour += metrics_by_friendly_name[friendly_name].costs_per_hour(
+                spec
+            )
         except KeyError:
             raise web.HTTPNotFound(reason=f"Unknown measurement `{friendly_name}`.")
         except TypeError:
             raise web.HTTPBadRequest(
                 reason=f"Parameter {friendly_name} had wrong type."
             )
-    return web.json_response(
+    return _json_response(
         float(costs_per_hour.quantize(config["OS_CREDITS_PRECISION"]))
     )
@@ -1,17 +1,34 @@
+from __future__ import annotations
+
 from asyncio import sleep
-from importlib import reload
-from logging import getLogger
+from logging import NOTSET, getLogger
+from os import environ
 
 from aiohttp.client_exceptions import ClientOSError, ServerDisconnectedError
 from pytest import fixture
+from pytest_localserver.smtp import Server
 
 from os_credits.influx.client import InfluxDBClient
 from os_credits.perun.group import Group
-from os_credits.settings import config
+from os_credits.settings import config, reset_config
+
+# reset the level of the aioinflux logger, it is inherited from the root logger then
+getLogger("aioinflux").setLevel(NOTSET)
+
+# give every worker of pytest-xdist its own databases inside the shared InfluxDB
+_XDIST_WORKER = environ.get("PYTEST_XDIST_WORKER")
+if _XDIST_WORKER:
+    for _database_setting in ("INFLUXDB_DB", "CREDITS_HISTORY_DB"):
+        environ[_database_setting] = f"{config[_database_setting]}_{_XDIST_WORKER}"
+    reset_config()
 
 # how many credits does every group, created during test runs, have
 TEST_INITIAL_CREDITS_GRANTED = 200
 
+# databases created by `fixture_influx_client` during this session. The client itself
+# cannot be shared between tests since it is bound to the event loop of every test
+_created_databases = set()
+
 
 @fixture(name="perun_test_group")
 def fixture_perun_test_group() -> Group:
@@ -31,40 +48,64 @@ def fixture_perun_test_group() -> Group:
 @fixture(name="settings_reload_after_use", autouse=True)
 def fixture_settings_reload_after_use():
     "Make sure that settings are reset after every run"
-    from os_credits import settings
-
+    # tests rebuild the config via `reset_config` or modify it directly, but the config
+    # object itself is always the same
+    config_snapshot = dict(config)
     yield
-    reload(settings)
+    config.clear()
+    config.update(config_snapshot)
+
+
+@fixture(name="session_smtpserver", scope="session")
+def fixture_session_smtpserver():
+    "Single smtp server for the whole session instead of one per test"
+    server = Server()
+    server.start()
+    yield server
+    server.stop()
 
 
 @fixture(name="smtpserver")
-def fixture_smtpserver(smtpserver, monkeypatch):
+def fixture_smtpserver(session_smtpserver, monkeypatch):
     from os_credits import settings
 
+    smtpserver = session_smtpserver
+    # every test only sees the mails it has sent
+    smtpserver.outbox.clear()
     monkeypatch.setenv("MAIL_SMTP_SERVER", str(smtpserver.addr[0]))
     monkeypatch.setenv("MAIL_SMTP_PORT", str(smtpserver.addr[1]))
     monkeypatch.setenv("MAIL_NOT_STARTTLS", "1")
-    reload(settings)
+    settings.reset_config()
     return smtpserver
 
 
+async def _wait_until_up(influx_client, loop, timeout=10.0):
+    "Ping InfluxDB with exponential backoff until it answers"
+    delay = 0.05
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            await influx_client.ping()
+            return
+        except (ClientOSError, ServerDisconnectedError):
+            if loop.time() > deadline:
+                raise TimeoutError(f"InfluxDB not up after {timeout} seconds")
+            await sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+
 @fixture(name="influx_client")
 async def fixture_influx_client(loop):
 
     influx_client = InfluxDBClient(loop=loop)
-    influx_client.db = config["INFLUXDB_DB"]
-    getLogger("aioinflux").level = 0
-    await influx_client.ping()
+    await _wait_until_up(influx_client, loop)
     # in production the application cannot create any databases since it does not admin
     # access to the InfluxDB and HTTP_AUTH is enabled, see the `project_usage` repo
-    await influx_client.query(f"create database {config['CREDITS_HISTORY_DB']}")
-    while True:
-        try:
-            await influx_client.ping()
-            break
-        except (ClientOSError, ServerDisconnectedError):
-            print("Sleeping for 1 second until InfluxDB is up")
-            await sleep(1)
+    # only the series are dropped after every test, so create them once per session
+    for database in (config["INFLUXDB_DB"], config["CREDITS_HISTORY_DB"]):
+        if database not in _created_databases:
+            await influx_client.query(f"create database {database}")
+            _created_databases.add(database)
     yield influx_client
     # clear all data from pytest and credits_history_db
     await influx_client.query("drop series from /.*/", db=config["INFLUXDB_DB"])
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from os_credits.perun.attributes import DenbiCreditsGranted
 from os_credits.perun.base_attributes import PerunAttribute
@@ -11,56 +12,91 @@ from .conftest import TEST_INITIAL_CREDITS_GRANTED
 
 # replaces `os_credits.perun.groupsManager.get_group_by_name`
 async def get_group_by_name(name: str) -> Dict[str, Any]:
+    # copy, callers may modify the returned dict
+    return dict(_build_group(name))
+
+
+# fields of every fake group which do not depend on its name
+_GROUP_TEMPLATE: Dict[str, Any] = {
+    "createdAt": "2000-01-01 00:00:00.000000",
+    "createdBy": "unknown@example.com",
+    "modifiedAt": "2000-01-01 00:00:00.000000",
+    "modifiedBy": "unknown@example.com",
+    "createdByUid": 0,
+    "modifiedByUid": 0,
+    "voId": 0,
+    "parentGroupId": None,
+    "beanName": "Group",
+}
+
+
+@lru_cache(maxsize=1024)
+def _build_group(name: str) -> Mapping[str, Any]:
     # create fake 8 digit id from name, must not be random since used as key in
     # _test_mode_group_attributes
     group_id = abs(hash(name) % (10 ** 8))
-    return {
-        "id": group_id,
-        "createdAt": "2000-01-01 00:00:00.000000",
-        "createdBy": "unknown@example.com",
-        "modifiedAt": "2000-01-01 00:00:00.000000",
-        "modifiedBy": "unknown@example.com",
-        "createdByUid": 0,
-        "modifiedByUid": 0,
-        "voId": 0,
-        "parentGroupId": None,
-        "name": name,
-        "description": f"Dummy offline group ({group_id})",
-        "shortName": name,
-        "beanName": "Group",
-    }
+    return MappingProxyType(
+        {
+            **_GROUP_TEMPLATE,
+            "id": group_id,
+            "name": name,
+            "description": f"Dummy offline group ({group_id})",
+            "shortName": name,
+        }
+    )
+
+
+# initial credits of every group, serialized once and read-only, every group gets its
+# own copy
+_INITIAL_CREDITS_KEY = DenbiCreditsGranted.get_full_name()
+_INITIAL_CREDITS_DICT: MappingProxyType[str, Any] = MappingProxyType(
+    DenbiCreditsGranted(value=TEST_INITIAL_CREDITS_GRANTED).to_perun_dict()
+)
+
+
+class _ResourceAttributes(dict):
+    "Storage of resource bound attributes, empty for every new group/resource pair"
+    __slots__ = ()
+
+    def __missing__(self, key: Tuple[int, int]) -> Dict[str, Dict[str, Any]]:
+        value: Dict[str, Dict[str, Any]] = {}
+        self[key] = value
+        return value
+
+
+class _GroupAttributes(dict):
+    "Storage of group attributes, every new group starts with the initial credits"
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> Dict[str, Dict[str, Any]]:
+        value = {_INITIAL_CREDITS_KEY: _INITIAL_CREDITS_DICT.copy()}
+        self[key] = value
+        return value
 
 
 # Used during test runs to emulate Perun's storage capabilities
 _test_mode_resource_attributes: Dict[
     Tuple[int, int], Dict[str, Dict[str, Any]]
-] = defaultdict(lambda: {})
-# Insert any initial values by using a defaultdict
-_test_mode_group_attributes: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(
-    lambda: {
-        DenbiCreditsGranted.get_full_name(): DenbiCreditsGranted(
-            value=TEST_INITIAL_CREDITS_GRANTED
-        ).to_perun_dict()
-    }
-)
+] = _ResourceAttributes()
+_test_mode_group_attributes: Dict[int, Dict[str, Dict[str, Any]]] = _GroupAttributes()
 
 
+# Both getters return a new list, just like the originals which decode a fresh response
+# from Perun. A view of the storage would instead reflect attributes saved by other
+# tasks while `Group.connect` is still awaiting its second request.
 # replaces `os_credits.perun.attributesManager.get_resource_bound_attributes`
 async def get_resource_bound_attributes(
-    group_id: int, resource_id: int, attribute_full_names: Optional[List[str]] = None
+    group_id: int,
+    resource_id: int,
+    attribute_full_names: Optional[Sequence[str]] = None,
 ) -> List[Dict[str, Any]]:
-    return [
-        attribute
-        for attribute in _test_mode_resource_attributes[
-            (group_id, resource_id)
-        ].values()
-    ]
+    return list(_test_mode_resource_attributes[(group_id, resource_id)].values())
 
 
 async def get_attributes(
-    group_id: int, attribute_full_names: Optional[List[str]] = None
+    group_id: int, attribute_full_names: Optional[Sequence[str]] = None
 ) -> List[Dict[str, Any]]:
-    return [attribute for attribute in _test_mode_group_attributes[group_id].values()]
+    return list(_test_mode_group_attributes[group_id].values())
 
 
 async def is_assigned_resource(self) -> bool:
@@ -77,16 +113,23 @@ async def set_attribute(group_id: int, attribute: PerunAttribute[Any]) -> None:
 
 
 async def set_resource_bound_attributes(
-    group_id: int, resource_id: int, attributes: List[PerunAttribute[Any]]
+    group_id: int,
+    resource_id: int,
+    attributes: List[PerunAttribute[Any]],
+    only_changed: bool = False,
 ) -> None:
-    for attribute in attributes:
-        _test_mode_resource_attributes[(group_id, resource_id)][
-            attribute.friendlyName
-        ] = attribute.to_perun_dict()
+    _test_mode_resource_attributes[(group_id, resource_id)].update(
+        (attribute.friendlyName, attribute.to_perun_dict())
+        for attribute in attributes
+        if not only_changed or attribute.has_changed
+    )
 
 
-async def set_attributes(group_id: int, attributes: List[PerunAttribute[Any]]) -> None:
-    for attribute in attributes:
-        _test_mode_group_attributes[group_id][
-            attribute.friendlyName
-        ] = attribute.to_perun_dict()
+async def set_attributes(
+    group_id: int, attributes: List[PerunAttribute[Any]], only_changed: bool = False
+) -> None:
+    _test_mode_group_attributes[group_id].update(
+        (attribute.friendlyName, attribute.to_perun_dict())
+        for attribute in attributes
+        if not only_changed or attribute.has_changed
+    )
@@ -1,3 +1,6 @@
+from datetime import datetime
+from decimal import Decimal
+from json import loads
 from typing import List, Optional
 
 import pytest
@@ -5,10 +8,17 @@ import pytest
 from os_credits.perun.attributes import (
     ContainerPerunAttribute,
     DenbiCreditsGranted,
+    DenbiCreditsUsed,
     DenbiCreditTimestamps,
     ScalarPerunAttribute,
+    ToEmail,
 )
-from os_credits.perun.base_attributes import PerunAttribute
+from os_credits.perun.base_attributes import (
+    PerunAttribute,
+    _TrackedDict,
+    _TrackedList,
+)
+from os_credits.perun.exceptions import DenbiCreditsGrantedMissing
 
 
 @pytest.fixture(name="ContainerTestAttribute")
@@ -84,6 +94,11 @@ def test_container_none_value_false():
         ), f"No provided value must evaluate to False, error for attribute {attr_class}"
 
 
+def test_subscription_returns_class():
+    assert ScalarPerunAttribute[int] is ScalarPerunAttribute
+    assert ContainerPerunAttribute[List[str]] is ContainerPerunAttribute
+
+
 def test_changed_indicator():
     my_attr = DenbiCreditTimestamps(value=None, displayName="test")
     assert not my_attr.has_changed
@@ -99,3 +114,200 @@ def test_credits_granted_read_only():
     credits_granted = DenbiCreditsGranted(value="100")
     with pytest.raises(AttributeError):
         credits_granted.value = 200
+
+
+def _ior(container, other):
+    container |= other
+
+
+def _iadd(container, other):
+    container += other
+
+
+def _imul(container, other):
+    container *= other
+
+
+def _setitem(container, key, value):
+    container[key] = value
+
+
+def _delitem(container, key):
+    del container[key]
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: _setitem(d, "c", 3),
+        lambda d: _setitem(d, "a", 3),
+        lambda d: _delitem(d, "a"),
+        lambda d: _ior(d, {"c": 3}),
+        lambda d: d.clear(),
+        lambda d: d.pop("a"),
+        lambda d: d.pop("c", None),
+        lambda d: d.popitem(),
+        lambda d: d.setdefault("c", 3),
+        lambda d: d.update(c=3),
+    ],
+)
+def test_tracked_dict_mutators(mutate):
+    container = _TrackedDict(a=1, b=2)
+    assert not container._dirty
+    assert container._version == 0
+    mutate(container)
+    assert container._dirty
+    assert container._version == 1
+    container._dirty = False
+    assert container._version == 1, "Resetting the dirty flag must keep the version"
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda lst: _setitem(lst, 0, 3),
+        lambda lst: _setitem(lst, slice(0, 1), [3, 4]),
+        lambda lst: _delitem(lst, 0),
+        lambda lst: _iadd(lst, [3]),
+        lambda lst: _imul(lst, 2),
+        lambda lst: lst.append(3),
+        lambda lst: lst.clear(),
+        lambda lst: lst.extend([3]),
+        lambda lst: lst.insert(0, 3),
+        lambda lst: lst.pop(),
+        lambda lst: lst.remove(1),
+        lambda lst: lst.reverse(),
+        lambda lst: lst.sort(reverse=True),
+    ],
+)
+def test_tracked_list_mutators(mutate):
+    container = _TrackedList([1, 2])
+    assert not container._dirty
+    assert container._version == 0
+    mutate(container)
+    assert container._dirty
+    assert container._version == 1
+    container._dirty = False
+    assert container._version == 1, "Resetting the dirty flag must keep the version"
+
+
+def test_tracked_in_place_operators_keep_type():
+    tracked_dict = _TrackedDict(a=1)
+    tracked_dict |= {"b": 2}
+    assert type(tracked_dict) is _TrackedDict
+    assert tracked_dict == {"a": 1, "b": 2}
+    tracked_list = _TrackedList([1])
+    tracked_list += [2]
+    tracked_list *= 2
+    assert type(tracked_list) is _TrackedList
+    assert tracked_list == [1, 2, 1, 2]
+    assert tracked_list._version == 2
+
+
+def test_scalar_setter_invalidates_encoding():
+    credits_used = DenbiCreditsUsed(value="100")
+    encoded = credits_used.to_perun_bytes()
+    assert credits_used.to_perun_bytes() is encoded, "Unchanged encoding not reused"
+    credits_used.value = Decimal("50")
+    assert loads(credits_used.to_perun_bytes()) == credits_used.to_perun_dict()
+    assert loads(credits_used.to_perun_bytes())["value"] == "50"
+
+
+def test_container_modification_invalidates_encoding():
+    timestamps = DenbiCreditTimestamps(value=None)
+    encoded = timestamps.to_perun_bytes()
+    assert timestamps.to_perun_bytes() is encoded, "Unchanged encoding not reused"
+    timestamps.value["cpu"] = datetime(2019, 1, 1)
+    assert loads(timestamps.to_perun_bytes())["value"] == {
+        "cpu": "2019-01-01 00:00:00.000000"
+    }
+    # resetting the changed indicator must not bring back the stale encoding
+    timestamps.has_changed = False
+    del timestamps.value["cpu"]
+    assert loads(timestamps.to_perun_bytes())["value"] == {}
+
+
+# empty and non-empty values as sent by *Perun* to test all attributes with, in
+# addition to None
+_PERUN_VALUES = {
+    "DenbiCreditsUsed": ["", "100.25"],
+    "DenbiCreditsGranted": ["100"],
+    "ToEmail": [[], ["test@example.com", "test2@example.com"]],
+    "DenbiCreditTimestamps": [
+        {},
+        {"cpu": "2019-01-01 00:00:00.000000", "ram": "2019-02-03 04:05:06.000007"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "attr_class,value",
+    [
+        (attr_class, value)
+        for name, attr_class in PerunAttribute.registered_attributes.items()
+        for value in [None, *_PERUN_VALUES.get(name, [])]
+    ],
+)
+def test_generated_to_perun_dict(attr_class, value):
+    try:
+        attr = attr_class(value=value)
+    except DenbiCreditsGrantedMissing:
+        pytest.skip("Attribute does not allow empty values")
+    assert attr_class.to_perun_dict is not PerunAttribute.to_perun_dict
+    assert attr.to_perun_dict() == PerunAttribute.to_perun_dict(attr)
+
+
+@pytest.mark.parametrize(
+    "attr,expected",
+    [
+        (DenbiCreditsUsed(value=None), "DenbiCreditsUsed(value=None)"),
+        (ToEmail(value=None), "ToEmail(value=None)"),
+        (DenbiCreditTimestamps(value={}), "DenbiCreditTimestamps(value=None)"),
+        (
+            DenbiCreditsUsed(value="100.25"),
+            "DenbiCreditsUsed(value=100.25,friendlyName='denbiCreditsCurrent',id=3382,"
+            "type='java.lang.String',namespace='urn:perun:group:attribute-def:opt')",
+        ),
+        (
+            DenbiCreditsGranted(value="100"),
+            "DenbiCreditsGranted(value=100,friendlyName='denbiCreditsGranted',id=3383,"
+            "type='java.lang.String',namespace='urn:perun:group:attribute-def:opt')",
+        ),
+        (
+            ToEmail(value=["test@example.com"]),
+            "ToEmail(value=['test@example.com'],friendlyName='toEmail',id=2020,"
+            "type='java.util.ArrayList',namespace='urn:perun:group:attribute-def:def')",
+        ),
+        (
+            DenbiCreditTimestamps(value={"cpu": "2019-01-01 00:00:00.000000"}),
+            "DenbiCreditTimestamps(value={'cpu': datetime.datetime(2019, 1, 1, 0, 0)},"
+            "friendlyName='denbiCreditTimestamps',id=3386,"
+            "type='java.util.LinkedHashMap',"
+            "namespace='urn:perun:group_resource:attribute-def:opt')",
+        ),
+    ],
+)
+def test_generated_repr(attr, expected):
+    assert repr(attr) == expected
+
+
+def test_generated_repr_unset_attributes():
+    class _ReprTestAttribute(
+        ScalarPerunAttribute[Optional[str]],
+        perun_id=1,
+        perun_friendly_name="myReprTestAttr",
+        perun_type="test",
+        perun_namespace="test",
+    ):
+        comment: str
+
+    attr = _ReprTestAttribute(value="test")
+    assert repr(attr) == (
+        "_ReprTestAttribute(value=test,friendlyName='myReprTestAttr',id=1,type='test',"
+        "namespace='test')"
+    )
+    attr.comment = "set"
+    assert repr(attr) == (
+        "_ReprTestAttribute(value=test,friendlyName='myReprTestAttr',id=1,type='test',"
+        "namespace='test',comment='set')"
+    )
@@ -0,0 +1,144 @@
+from datetime import datetime
+from decimal import Decimal
+from json import dumps, loads
+
+import pytest
+
+import os_credits.perun.attributesManager
+from os_credits.perun.attributes import DenbiCreditsUsed, DenbiCreditTimestamps, ToEmail
+from os_credits.perun.attributesManager import (
+    flush_attributes,
+    set_attribute,
+    set_attributes,
+    set_resource_bound_attributes,
+)
+
+
+@pytest.fixture(name="sent_requests")
+def fixture_sent_requests(monkeypatch):
+    """Replaces `perun_set` and collects the url and decoded body of every request
+    instead of sending it.
+    """
+    requests = []
+
+    async def perun_set(url, params=None):
+        requests.append((url, loads(params)))
+
+    monkeypatch.setattr(os_credits.perun.attributesManager, "perun_set", perun_set)
+    return requests
+
+
+async def test_set_attributes(sent_requests):
+    credits_used = DenbiCreditsUsed(value="100")
+    to_email = ToEmail(value=["test@example.com"])
+    await set_attributes(1, [credits_used, to_email])
+    assert sent_requests == [
+        (
+            "attributesManager/setAttributes",
+            {
+                "group": 1,
+                "attributes": [credits_used.to_perun_dict(), to_email.to_perun_dict()],
+            },
+        )
+    ], "Unchanged attributes must be sent by default"
+
+
+async def test_set_attributes_only_changed(sent_requests):
+    credits_used = DenbiCreditsUsed(value="100")
+    to_email = ToEmail(value=["test@example.com"])
+    await set_attributes(1, [credits_used, to_email], only_changed=True)
+    assert sent_requests == [], "Request sent although no attribute has changed"
+
+    credits_used.value = Decimal("50")
+    await set_attributes(1, [credits_used, to_email], only_changed=True)
+    assert sent_requests == [
+        (
+            "attributesManager/setAttributes",
+            {"group": 1, "attributes": [credits_used.to_perun_dict()]},
+        )
+    ]
+
+
+async def test_set_resource_bound_attributes_only_changed(sent_requests):
+    unchanged = DenbiCreditTimestamps(value=None)
+    changed = DenbiCreditTimestamps(value=None)
+    await set_resource_bound_attributes(1, 2, [unchanged, changed], only_changed=True)
+    assert sent_requests == [], "Request sent although no attribute has changed"
+
+    changed.value["cpu"] = datetime(2019, 1, 1)
+    await set_resource_bound_attributes(1, 2, [unchanged, changed], only_changed=True)
+    assert sent_requests == [
+        (
+            "attributesManager/setAttributes",
+            {"group": 1, "resource": 2, "attributes": [changed.to_perun_dict()]},
+        )
+    ]
+
+
+async def test_set_attributes_body(sent_requests):
+    """The request body is spliced together from the encoded attributes, it must be
+    identical to encoding the whole request at once.
+    """
+    attributes = [
+        DenbiCreditsUsed(value="100.25"),
+        ToEmail(value=["test@example.com", "test2@example.com"]),
+    ]
+    await set_attributes(1, attributes)
+    expected = {"group": 1, "attributes": [attr.to_perun_dict() for attr in attributes]}
+    assert sent_requests[0][1] == loads(dumps(expected))
+
+
+async def test_set_resource_bound_attributes_body(sent_requests):
+    timestamps = DenbiCreditTimestamps(
+        value={"cpu": "2019-01-01 00:00:00.000000", "ram": "2019-02-03 04:05:06.000007"}
+    )
+    await set_resource_bound_attributes(1, 2, [timestamps])
+    expected = {"group": 1, "resource": 2, "attributes": [timestamps.to_perun_dict()]}
+    assert sent_requests[0][1] == loads(dumps(expected))
+
+
+async def test_set_attribute(sent_requests):
+    credits_used = DenbiCreditsUsed(value="100")
+    await set_attribute(1, credits_used)
+    assert sent_requests == [
+        (
+            "attributesManager/setAttributes",
+            {"group": 1, "attributes": [credits_used.to_perun_dict()]},
+        )
+    ]
+
+
+async def test_flush_attributes(sent_requests):
+    credits_used = DenbiCreditsUsed(value="100")
+    to_email = ToEmail(value=["test@example.com"])
+    timestamps = DenbiCreditTimestamps(value=None)
+    await flush_attributes(1, [credits_used, to_email, timestamps], resource_id=2)
+    assert sent_requests == [], "Request sent although no attribute has changed"
+
+    credits_used.value = Decimal("50")
+    to_email.value.append("test2@example.com")
+    timestamps.value["cpu"] = datetime(2019, 1, 1)
+    await flush_attributes(1, [credits_used, to_email, timestamps], resource_id=2)
+    assert sorted(sent_requests, key=lambda request: len(request[1])) == [
+        (
+            "attributesManager/setAttributes",
+            {
+                "group": 1,
+                "attributes": [credits_used.to_perun_dict(), to_email.to_perun_dict()],
+            },
+        ),
+        (
+            "attributesManager/setAttributes",
+            {"group": 1, "resource": 2, "attributes": [timestamps.to_perun_dict()]},
+        ),
+    ], "Expected one request per kind of attribute"
+
+
+async def test_flush_attributes_requires_resource_id(sent_requests):
+    timestamps = DenbiCreditTimestamps(value=None)
+    timestamps.value["cpu"] = datetime(2019, 1, 1)
+    credits_used = DenbiCreditsUsed(value="100")
+    credits_used.value = Decimal("50")
+    with pytest.raises(ValueError):
+        await flush_attributes(1, [credits_used, timestamps])
+    assert sent_requests == [], "Nothing must be sent if a request is invalid"
@@ -2,10 +2,13 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from http import HTTPStatus
 
+import pytest
+
 from os_credits.credits.base_models import Credits
 from os_credits.credits.models import BillingHistory
 from os_credits.influx.client import InfluxDBClient
 from os_credits.main import create_app
+from os_credits.views import _PROJECT_NAME_RE
 
 datetime_format = "%Y-%m-%d %H:%M:%S"
 
@@ -81,3 +84,26 @@ async def test_invalid_params(aiohttp_client, influx_client):
     assert (
         resp.status == HTTPStatus.BAD_REQUEST
     ), "Accepted invalid combination of date params"
+
+
+# the check used to be `project_name == "{project_name}" or not project_name.strip()`
+@pytest.mark.parametrize(
+    "project_name",
+    [
+        "test",
+        "test_project-1.2",
+        " test ",
+        "test project",
+        "Tést",
+        "{test}",
+        " {project_name}",
+        "a" * 1000,
+    ],
+)
+def test_project_name_accepted(project_name):
+    assert _PROJECT_NAME_RE.fullmatch(project_name)
+
+
+@pytest.mark.parametrize("project_name", ["", " ", "\t\n", "\u00a0", "{project_name}"])
+def test_project_name_rejected(project_name):
+    assert not _PROJECT_NAME_RE.fullmatch(project_name)
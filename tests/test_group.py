@@ -1,6 +1,11 @@
 import pytest
 
+import os_credits.perun.group
 from os_credits.perun.attributes import DenbiCreditsUsed
+from os_credits.perun.exceptions import GroupResourceNotAssociatedError
+from os_credits.perun.group import Group
+
+from .patches import get_attributes, get_group_by_name
 
 
 def test_perun_attr_setattr(perun_test_group):
@@ -8,3 +13,28 @@ def test_perun_attr_setattr(perun_test_group):
     perun_test_group.credits_used = credits_used
     with pytest.raises(AttributeError):
         perun_test_group.credits_used = 5
+
+
+async def test_connect_checks_resource_first(monkeypatch):
+    requested_resources = []
+
+    async def is_assigned_resource(self):
+        return False
+
+    async def get_resource_bound_attributes(group_id, resource_id, **kwargs):
+        requested_resources.append(resource_id)
+        return []
+
+    monkeypatch.setattr(os_credits.perun.group, "get_group_by_name", get_group_by_name)
+    monkeypatch.setattr(os_credits.perun.group, "get_attributes", get_attributes)
+    monkeypatch.setattr(
+        os_credits.perun.group,
+        "get_resource_bound_attributes",
+        get_resource_bound_attributes,
+    )
+    monkeypatch.setattr(Group, "is_assigned_resource", is_assigned_resource)
+    with pytest.raises(GroupResourceNotAssociatedError):
+        await Group("test_group", 1).connect()
+    assert (
+        not requested_resources
+    ), "Resource bound attributes requested for a resource not assigned to the group"
@@ -1,4 +1,3 @@
-from importlib import reload
 from os import getenv
 from random import randint
 
@@ -31,7 +30,7 @@ async def test_bad_credentials(perun_test_group: Group, monkeypatch):
 
     monkeypatch.setenv("OS_CREDITS_PERUN_LOGIN", "bogus")
     monkeypatch.setenv("OS_CREDITS_PERUN_PASSWORD", "bogus")
-    reload(settings)
+    settings.reset_config()
 
     with pytest.raises(BadCredentialsException):
         await get_group_by_name(perun_test_group.name)
@@ -0,0 +1,35 @@
+from contextvars import Context, copy_context
+
+from os_credits.perun import requests
+from os_credits.perun.requests import (
+    _get_fallback_session,
+    _get_session,
+    client_session,
+    close_fallback_session,
+    create_perun_session,
+)
+
+
+async def test_session_per_context():
+    app_session = create_perun_session()
+    other_app_session = create_perun_session()
+
+    def use_other_app_session():
+        client_session.set(other_app_session)
+        return _get_session()
+
+    try:
+        client_session.set(app_session)
+        assert _get_session() is app_session
+        assert copy_context().run(use_other_app_session) is other_app_session
+        assert (
+            Context().run(_get_session) is _get_fallback_session()
+        ), "Session of another context used instead of the fallback one"
+        assert _get_session() is app_session
+        await app_session.close()
+        assert _get_session() is _get_fallback_session(), "Closed session used"
+    finally:
+        await app_session.close()
+        await other_app_session.close()
+        await close_fallback_session()
+        requests._cached_session = None
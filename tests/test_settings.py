@@ -1,5 +1,4 @@
 from decimal import Decimal
-from importlib import reload
 
 
 def test_parsing_special_values(monkeypatch):
@@ -14,7 +13,7 @@ def test_parsing_special_values(monkeypatch):
     monkeypatch.setenv("INFLUXDB_PORT", str(integer_conf_value))
     monkeypatch.setenv("OS_CREDITS_PRECISION", str(3))
     # necessary to pickup changed environment variables
-    reload(settings)
+    settings.reset_config()
     from os_credits.settings import config
 
     assert (
@@ -31,7 +30,7 @@ def test_bad_int_values(monkeypatch):
 
     bad_test_port = -324
     monkeypatch.setenv("INFLUXDB_PORT", str(bad_test_port))
-    reload(settings)
+    settings.reset_config()
     from os_credits.settings import config
 
     assert (
@@ -43,7 +42,7 @@ def test_bad_int_values(monkeypatch):
 
     invalid_int_value = "lala"
     monkeypatch.setenv("INFLUXDB_PORT", invalid_int_value)
-    reload(settings)
+    settings.reset_config()
     from os_credits.settings import config
 
     assert (
@@ -0,0 +1,25 @@
+from asyncio import Queue
+
+import pytest
+from aiohttp import web
+
+from os_credits.views import influxdb_write
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"first value=1\nsecond value=2\n",
+        b"first value=1\r\nsecond value=2\r\n",
+        b"first value=1\r\nsecond value=2",
+    ],
+)
+async def test_influxdb_write_lines(aiohttp_client, body):
+    app = web.Application()
+    app["task_queue"] = Queue()
+    app.router.add_post("/write", influxdb_write)
+    http_client = await aiohttp_client(app)
+    resp = await http_client.post("/write", data=body)
+    assert resp.status == 202
+    queued = [app["task_queue"].get_nowait() for _ in range(app["task_queue"].qsize())]
+    assert queued == body.decode().splitlines() == ["first value=1", "second value=2"]